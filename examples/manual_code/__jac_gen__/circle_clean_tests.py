@@ -0,0 +1,30 @@
+from __future__ import annotations
+from jaclang import jac_import as __jac_import__
+import typing as _jac_typ
+from enum import Enum as __jac_Enum__, auto as __jac_auto__
+from jaclang.plugin.feature import JacFeature as _Jac
+from jaclang.plugin.builtin import *
+import abc as _jac_abc
+from dataclasses import dataclass as __jac_dataclass__
+if _jac_typ.TYPE_CHECKING:
+    from circle_clean import *
+else:
+    _jac_inc_circle_clean, = __jac_import__(target='circle_clean', base_path=__file__, lng='jac', absorb=True, mdl_alias=None, items={})
+    for i in _jac_inc_circle_clean.__all__ if '__all__' in _jac_inc_circle_clean.__dict__ else _jac_inc_circle_clean.__dict__:
+        if not i.startswith('_'):
+            exec(f"{i}=_jac_inc_circle_clean.__dict__['{i}']")
+expected_area = 78.53981633974483
+
+@_Jac.create_test
+def test__jac_gen_99(_jac_check) -> None:
+    _jac_check.assertAlmostEqual(calculate_area(RAD), expected_area)
+
+@_Jac.create_test
+def test__jac_gen_100(_jac_check) -> None:
+    c = Circle(RAD)
+    _jac_check.assertAlmostEqual(c.area(), expected_area)
+
+@_Jac.create_test
+def test__jac_gen_101(_jac_check) -> None:
+    c = Circle(RAD)
+    _jac_check.assertEqual(c.shape_type, ShapeType.CIRCLE)
\ No newline at end of file
@@ -0,0 +1,53 @@
+"""Example of simple walker walking nodes."""
+from __future__ import annotations
+from jaclang.plugin.feature import JacFeature as _Jac
+from jaclang.plugin.builtin import *
+from dataclasses import dataclass as __jac_dataclass__
+
+@_Jac.make_node(on_entry=[], on_exit=[])
+@__jac_dataclass__(eq=False)
+class Item(_Jac.Node):
+    value: int = _Jac.has_instance_default(gen_func=lambda: 1)
+
+@_Jac.make_edge(on_entry=[], on_exit=[])
+@__jac_dataclass__(eq=False)
+class Checking(_Jac.Edge):
+    pass
+
+@_Jac.make_walker(on_entry=[_Jac.DSFunc('create', _Jac.RootType | Item)], on_exit=[])
+@__jac_dataclass__(eq=False)
+class Creator(_Jac.Walker):
+    count: int = _Jac.has_instance_default(gen_func=lambda: 0)
+
+    def create(self, _jac_here_: _Jac.RootType | Item) -> None:
+        _Jac.connect(left=_jac_here_, right=Item(), edge_spec=_Jac.build_edge(is_undirected=False, conn_type=None, conn_assign=None))
+        self.count += 1
+        if self.count < 10:
+            if _Jac.visit_node(self, _Jac.edge_ref(_jac_here_, target_obj=None, dir=_Jac.EdgeDir.OUT, filter_func=None, edges_only=False)):
+                pass
+
+@_Jac.make_walker(on_entry=[_Jac.DSFunc('skip_root', _Jac.RootType), _Jac.DSFunc('step', Item)], on_exit=[])
+@__jac_dataclass__(eq=False)
+class Walk(_Jac.Walker):
+    count: int = _Jac.has_instance_default(gen_func=lambda: 0)
+
+    def skip_root(self, _jac_here_: _Jac.RootType) -> None:
+        if _Jac.visit_node(self, _Jac.edge_ref(_jac_here_, target_obj=None, dir=_Jac.EdgeDir.OUT, filter_func=None, edges_only=False)):
+            pass
+
+    def step(self, _jac_here_: Item) -> None:
+        _jac_here_.value = self.count
+        self.count += 1
+        if _Jac.visit_node(self, _Jac.edge_ref(_jac_here_, target_obj=None, dir=_Jac.EdgeDir.OUT, filter_func=None, edges_only=False)):
+            pass
+        else:
+            print(f'Final Value: {_jac_here_.value - 1}')
+            print('Done walking.')
+            _Jac.disengage(self)
+            return
+        print(f'Value: {_jac_here_.value - 1}')
+
+def test_run() -> None:
+    _Jac.spawn_call(_Jac.get_root(), Creator())
+    _Jac.spawn_call(Walk(), _Jac.get_root())
+test_run()
\ No newline at end of file
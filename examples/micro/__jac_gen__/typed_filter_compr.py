@@ -0,0 +1,24 @@
+from __future__ import annotations
+from jaclang.plugin.feature import JacFeature as _Jac
+from jaclang.plugin.builtin import *
+from dataclasses import dataclass as __jac_dataclass__
+
+@_Jac.make_node(on_entry=[], on_exit=[])
+@__jac_dataclass__(eq=False)
+class MyObj(_Jac.Node):
+    a: int
+
+@_Jac.make_node(on_entry=[], on_exit=[])
+@__jac_dataclass__(eq=False)
+class MyObj2(_Jac.Node):
+    a: int
+my_list = []
+i = 0
+while i < 10:
+    my_list.append(MyObj(a=i))
+    my_list.append(MyObj2(a=i + 2))
+    i += 1
+print((lambda x: [i for i in x if i.a < 4])(my_list))
+print((lambda x: [i for i in x if isinstance(i, MyObj) if i.a < 4 if i.a < 3])(my_list))
+_Jac.assign_compr(my_list, (('a',), (5,)))
+print(my_list)
\ No newline at end of file
@@ -1,66 +1,89 @@
 """Command line interface tool for the Jac language."""
 
-import ast as ast3
 import importlib
 import marshal
 import os
 import pickle
 import shutil
 import types
-from typing import Optional
+from concurrent.futures import ProcessPoolExecutor
+from typing import BinaryIO, Optional
 
-import jaclang.compiler.absyntree as ast
 from jaclang import jac_import
 from jaclang.cli.cmdreg import CommandShell, cmd_registry
 from jaclang.compiler.compile import jac_file_to_pass
 from jaclang.compiler.constant import Constants
-from jaclang.compiler.passes.main.pyast_load_pass import PyastBuildPass
-from jaclang.compiler.passes.main.schedules import py_code_gen_typed
-from jaclang.compiler.passes.tool.schedules import format_pass
-from jaclang.plugin.builtin import dotgen
 from jaclang.plugin.feature import JacCmd as Cmd
 from jaclang.plugin.feature import JacFeature as Jac
 from jaclang.runtimelib.constructs import WalkerArchitype
 from jaclang.runtimelib.context import ExecutionContext
 from jaclang.runtimelib.machine import JacMachine, JacProgram
 from jaclang.utils.helpers import debugger as db
-from jaclang.utils.lang_tools import AstTool
+from jaclang.utils.helpers import is_cache_fresh, iter_jac_files
 
 
 Cmd.create_cmd()
 
+_JIR_MAGIC = b"JIR1"
+_CLEAN_TARGETS = frozenset({Constants.JAC_GEN_DIR, Constants.JAC_MYPY_CACHE})
+
+
+def _load_program(f: BinaryIO) -> JacProgram:
+    """Load a JacProgram from a .jir file, falling back to pickled IR bundles."""
+    if f.read(len(_JIR_MAGIC)) == _JIR_MAGIC:
+        return JacProgram(mod_bundle=None, bytecode=marshal.load(f))
+    f.seek(0)
+    return JacProgram(mod_bundle=pickle.load(f), bytecode=None)
+
+
+def _format_file(filename: str) -> tuple[bool, str]:
+    """Format a .jac file, returning (True, code) or (False, error message)."""
+    from jaclang.compiler.passes.tool.schedules import format_pass
+
+    try:
+        code_gen_format = jac_file_to_pass(filename, schedule=format_pass)
+    except Exception as e:
+        return False, f"{type(e).__name__}: {e}"
+    if code_gen_format.errors_had:
+        return False, ""
+    return True, code_gen_format.ir.gen.jac
+
 
 @cmd_registry.register
 def format(path: str, outfile: str = "", debug: bool = False) -> None:
     """Run the specified .jac file or format all .jac files in a given directory."""
 
-    def format_file(filename: str) -> None:
-        code_gen_format = jac_file_to_pass(filename, schedule=format_pass)
-        if code_gen_format.errors_had:
+    def write_file(filename: str, ok: bool, result: str) -> None:
+        if not ok:
             print(f"Errors occurred while formatting the file {filename}.")
+            if result:
+                print(result)
         elif debug:
-            print(code_gen_format.ir.gen.jac)
+            print(result)
         elif outfile:
             with open(outfile, "w") as f:
-                f.write(code_gen_format.ir.gen.jac)
+                f.write(result)
         else:
             with open(filename, "w") as f:
-                f.write(code_gen_format.ir.gen.jac)
+                f.write(result)
 
     if path.endswith(".jac"):
         if os.path.exists(path):
-            format_file(path)
+            write_file(path, *_format_file(path))
         else:
             print("File does not exist.")
     elif os.path.isdir(path):
-        count = 0
-        for root, _, files in os.walk(path):
-            for file in files:
-                if file.endswith(".jac"):
-                    file_path = os.path.join(root, file)
-                    format_file(file_path)
-                    count += 1
-        print(f"Formatted {count} '.jac' files.")
+        files = list(iter_jac_files(path))
+        if len(files) == 1:
+            write_file(files[0], *_format_file(files[0]))
+        elif files:
+            # files are formatted independently, so spread them across processes
+            with ProcessPoolExecutor() as executor:
+                for filename, (ok, result) in zip(
+                    files, executor.map(_format_file, files, chunksize=4)
+                ):
+                    write_file(filename, ok, result)
+        print(f"Formatted {len(files)} '.jac' files.")
     else:
         print("Not a .jac file or directory.")
 
@@ -96,9 +119,7 @@ def run(
         )
     elif filename.endswith(".jir"):
         with open(filename, "rb") as f:
-            JacMachine(base).attach_program(
-                JacProgram(mod_bundle=pickle.load(f), bytecode=None)
-            )
+            JacMachine(base).attach_program(_load_program(f))
             jac_import(
                 target=mod,
                 base_path=base,
@@ -143,9 +164,7 @@ def get_object(
         )
     elif filename.endswith(".jir"):
         with open(filename, "rb") as f:
-            JacMachine(base).attach_program(
-                JacProgram(mod_bundle=pickle.load(f), bytecode=None)
-            )
+            JacMachine(base).attach_program(_load_program(f))
             jac_import(
                 target=mod,
                 base_path=base,
@@ -172,15 +191,23 @@ def get_object(
 @cmd_registry.register
 def build(filename: str) -> None:
     """Build the specified .jac file."""
+    import jaclang.compiler.absyntree as ast
+    from jaclang.compiler.passes.main.schedules import py_code_gen_typed
+
     if filename.endswith(".jac"):
         out = jac_file_to_pass(file_path=filename, schedule=py_code_gen_typed)
         errs = len(out.errors_had)
         warnings = len(out.warnings_had)
         print(f"Errors: {errs}, Warnings: {warnings}")
-        for i in out.ir.flatten():
-            i.gen.clean()
+        mod_deps = out.ir.mod_deps if isinstance(out.ir, ast.Module) else {}
+        bytecode = {
+            os.path.abspath(path): mod.gen.py_bytecode
+            for path, mod in mod_deps.items()
+            if mod.gen.py_bytecode is not None
+        }
         with open(filename[:-4] + ".jir", "wb") as f:
-            pickle.dump(out.ir, f)
+            f.write(_JIR_MAGIC)
+            marshal.dump(bytecode, f)
     else:
         print("Not a .jac file.")
 
@@ -191,6 +218,8 @@ def check(filename: str, print_errs: bool = True) -> None:
 
     :param filename: The path to the .jac file.
     """
+    from jaclang.compiler.passes.main.schedules import py_code_gen_typed
+
     if filename.endswith(".jac"):
         out = jac_file_to_pass(
             file_path=filename,
@@ -260,9 +289,7 @@ def enter(
         )
     elif filename.endswith(".jir"):
         with open(filename, "rb") as f:
-            JacMachine(base).attach_program(
-                JacProgram(mod_bundle=pickle.load(f), bytecode=None)
-            )
+            JacMachine(base).attach_program(_load_program(f))
             ret_module = jac_import(
                 target=mod,
                 base_path=base,
@@ -328,12 +355,14 @@ def test(
 
 
 @cmd_registry.register
-def tool(tool: str, args: Optional[list] = None) -> None:
+def tool(tool: str, args: Optional[list[str]] = None) -> None:
     """Run the specified AST tool with optional arguments.
 
     :param tool: The name of the AST tool to run.
     :param args: Optional arguments for the AST tool.
     """
+    from jaclang.utils.lang_tools import AstTool
+
     if hasattr(AstTool, tool):
         try:
             if args and len(args):
@@ -353,13 +382,17 @@ def clean() -> None:
 
     from the current directory recursively.
     """
-    current_dir = os.getcwd()
-    for root, dirs, _files in os.walk(current_dir, topdown=True):
-        for folder_name in dirs[:]:
-            if folder_name in [Constants.JAC_GEN_DIR, Constants.JAC_MYPY_CACHE]:
-                folder_to_remove = os.path.join(root, folder_name)
-                shutil.rmtree(folder_to_remove)
-                print(f"Removed folder: {folder_to_remove}")
+    dirs = [os.getcwd()]
+    while dirs:
+        with os.scandir(dirs.pop()) as entries:
+            for entry in entries:
+                if not entry.is_dir(follow_symlinks=False):
+                    continue
+                if entry.name in _CLEAN_TARGETS:
+                    shutil.rmtree(entry.path)
+                    print(f"Removed folder: {entry.path}")
+                else:
+                    dirs.append(entry.path)
     print("Done cleaning.")
 
 
@@ -370,11 +403,17 @@ def debug(filename: str, main: bool = True, cache: bool = False) -> None:
     base = base if base else "./"
     mod = mod[:-4]
     if filename.endswith(".jac"):
-        bytecode = jac_file_to_pass(filename).ir.gen.py_bytecode
+        # reuse the bytecode cached by a previous import if it is still fresh
+        jbc_path = os.path.join(base, Constants.JAC_GEN_DIR, f"{mod}.jbc")
+        if cache and is_cache_fresh(jbc_path, filename):
+            with open(jbc_path, "rb") as f:
+                bytecode: Optional[bytes] = f.read()
+        else:
+            bytecode = jac_file_to_pass(filename).ir.gen.py_bytecode
         if bytecode:
             code = marshal.loads(bytecode)
             if db.has_breakpoint(bytecode):
-                run(filename, main, cache)
+                run(filename, main=main, cache=cache)
             else:
                 func = types.FunctionType(code, globals())
 
@@ -394,7 +433,7 @@ def dot(
     initial: str = "",
     depth: int = -1,
     traverse: bool = False,
-    connection: list[str] = [],  # noqa: B006
+    connection: Optional[list[str]] = None,
     bfs: bool = False,
     edge_limit: int = 512,
     node_limit: int = 512,
@@ -406,12 +445,14 @@ def dot(
     :param initial: The initial node for graph traversal (default is root node).
     :param depth: The maximum depth for graph traversal (-1 for unlimited depth, default is -1).
     :param traverse: Flag to indicate whether to traverse the graph (default is False).
-    :param connection: List of node connections(edge type) to include in the graph (default is an empty list).
+    :param connection: List of node connections(edge type) to include in the graph (default is None).
     :param bfs: Flag to indicate whether to use breadth-first search for traversal (default is False).
     :param edge_limit: The maximum number of edges allowed in the graph.
     :param node_limit: The maximum number of nodes allowed in the graph.
     :param saveto: Path to save the generated graph.
     """
+    from jaclang.plugin.builtin import dotgen
+
     if session == "":
         session = (
             cmd_registry.args.session
@@ -438,7 +479,7 @@ def dot(
                 node=node,
                 depth=depth,
                 traverse=traverse,
-                edge_type=connection,
+                edge_type=list(connection) if connection else [],
                 bfs=bfs,
                 edge_limit=edge_limit,
                 node_limit=node_limit,
@@ -466,6 +507,11 @@ def py2jac(filename: str) -> None:
 
     :param filename: The path to the .py file.
     """
+    import ast as ast3
+
+    import jaclang.compiler.absyntree as ast
+    from jaclang.compiler.passes.main.pyast_load_pass import PyastBuildPass
+
     if filename.endswith(".py"):
         with open(filename, "r") as f:
             code = PyastBuildPass(
@@ -483,8 +529,7 @@ def jac2py(filename: str) -> None:
     :param filename: The path to the .jac file.
     """
     if filename.endswith(".jac"):
-        with open(filename, "r"):
-            code = jac_file_to_pass(file_path=filename).ir.gen.py
+        code = jac_file_to_pass(file_path=filename).ir.gen.py
         print(code)
     else:
         print("Not a .jac file.")
@@ -508,10 +553,7 @@ def start_cli() -> None:
 
     command = cmd_registry.get(args.command)
     if command:
-        args_dict = vars(args)
-        args_dict.pop("command")
-        args_dict.pop("version", None)
-        ret = command.call(**args_dict)
+        ret = command.call(args)
         if ret:
             print(ret)
     else:
@@ -6,7 +6,8 @@ import argparse
 import cmd
 import inspect
 import pprint
-from typing import Callable, Optional
+from types import UnionType
+from typing import Any, Callable, Optional, Union, get_args, get_origin
 
 
 class Command:
@@ -14,15 +15,17 @@ class Command:
 
     func: Callable
     sig: inspect.Signature
+    arg_names: tuple[str, ...]
 
     def __init__(self, func: Callable) -> None:
         """Initialize a Command instance."""
         self.func = func
         self.sig = inspect.signature(func)
+        self.arg_names = tuple(self.sig.parameters)
 
-    def call(self, *args: list, **kwargs: dict) -> str:
-        """Call the associated function with the specified arguments and keyword arguments."""
-        return self.func(*args, **kwargs)
+    def call(self, args: argparse.Namespace) -> str:
+        """Call the associated function with the parsed command line arguments."""
+        return self.func(*(getattr(args, name) for name in self.arg_names))
 
 
 class CommandRegistry:
@@ -129,14 +132,21 @@ class CommandRegistry:
                         f"--{param_name}",
                         default=param.default,
                         help=arg_msg,
-                        type=(
-                            eval(param.annotation)
-                            if isinstance(param.annotation, str)
-                            else param.annotation
-                        ),
+                        type=self.arg_type(param.annotation),
                     )
         return func
 
+    @staticmethod
+    def arg_type(annotation: Any) -> Any:  # noqa: ANN401
+        """Get the argparse type of an annotation, unwrapping Optional."""
+        if isinstance(annotation, str):
+            annotation = eval(annotation)
+        if get_origin(annotation) in (Union, UnionType):
+            annotation = next(
+                arg for arg in get_args(annotation) if arg is not type(None)
+            )
+        return annotation
+
     def get(self, name: str) -> Optional[Command]:
         """Get the Command instance for a given command name."""
         return self.registry.get(name)
@@ -172,11 +182,10 @@ class CommandShell(cmd.Cmd):
 
     def default(self, line: str) -> None:
         """Process the command line input."""
-        args = vars(self.cmd_reg.parser.parse_args(line.split()))
-        command = self.cmd_reg.get(args["command"])
+        args = self.cmd_reg.parser.parse_args(line.split())
+        command = self.cmd_reg.get(args.command)
         if command:
-            args.pop("command")
-            ret = command.call(**args)
+            ret = command.call(args)
             if ret:
                 ret_str = pprint.pformat(ret, indent=2)
                 self.stdout.write(f"{ret_str}\n")
@@ -10,6 +10,7 @@ from types import EllipsisType
 from typing import (
     Any,
     Callable,
+    ClassVar,
     Generic,
     Optional,
     Sequence,
@@ -39,15 +40,40 @@ if TYPE_CHECKING:
 class AstNode:
     """Abstract syntax tree node for Jac."""
 
+    # Mixins that carry fields (AstSymbolNode, AstAccessNode, ...) leave out
+    # __slots__ since several of them are combined on one node, which slotted
+    # bases cannot share; their fields live in the instance dict.
+    __slots__ = (
+        "parent",
+        "kid",
+        "_sym_tab",
+        "_sub_node_tab",
+        "_in_mod_nodes",
+        "gen",
+        "meta",
+        "loc",
+    )
+    _node_name: ClassVar[str] = "AstNode"
+
+    def __init_subclass__(cls) -> None:
+        """Cache the node name on each node class."""
+        super().__init_subclass__()
+        cls._node_name = cls.__name__
+        # Nodes compare and hash by identity; passes key tables on occurrences.
+        if "__eq__" in cls.__dict__ or "__hash__" in cls.__dict__:
+            raise TypeError(f"{cls.__name__} must keep identity __eq__/__hash__")
+
     def __init__(self, kid: Sequence[AstNode]) -> None:
         """Initialize ast."""
         self.parent: Optional[AstNode] = None
-        self.kid: list[AstNode] = [x.set_parent(self) for x in kid]
+        for x in kid:
+            x.parent = self
+        self.kid: tuple[AstNode, ...] = tuple(kid)
         self._sym_tab: Optional[SymbolTable] = None
         self._sub_node_tab: dict[type, list[AstNode]] = {}
         self._in_mod_nodes: list[AstNode] = []
         self.gen: CodeGenTarget = CodeGenTarget()
-        self.meta: dict[str, str] = {}
+        self.meta: Optional[dict[str, str]] = None
         self.loc: CodeLocInfo = CodeLocInfo(*self.resolve_tok_range())
 
     @property
@@ -71,7 +97,7 @@ class AstNode:
         self, nodes: Sequence[AstNode], pos_update: bool = True
     ) -> AstNode:
         """Add kid left."""
-        self.kid = [*nodes, *self.kid]
+        self.kid = (*nodes, *self.kid)
         if pos_update:
             for i in nodes:
                 i.parent = self
@@ -82,7 +108,7 @@ class AstNode:
         self, nodes: Sequence[AstNode], pos_update: bool = True
     ) -> AstNode:
         """Add kid right."""
-        self.kid = [*self.kid, *nodes]
+        self.kid = (*self.kid, *nodes)
         if pos_update:
             for i in nodes:
                 i.parent = self
@@ -93,7 +119,7 @@ class AstNode:
         self, nodes: Sequence[AstNode], pos: int, pos_update: bool = True
     ) -> AstNode:
         """Insert kids at position."""
-        self.kid = [*self.kid[:pos], *nodes, *self.kid[pos:]]
+        self.kid = (*self.kid[:pos], *nodes, *self.kid[pos:])
         if pos_update:
             for i in nodes:
                 i.parent = self
@@ -102,7 +128,7 @@ class AstNode:
 
     def set_kids(self, nodes: Sequence[AstNode]) -> AstNode:
         """Set kids."""
-        self.kid = [*nodes]
+        self.kid = tuple(nodes)
         for i in nodes:
             i.parent = self
         self.loc.update_token_range(*self.resolve_tok_range())
@@ -176,16 +202,27 @@ class AstNode:
 
     def to_dict(self) -> dict[str, str]:
         """Return dict representation of node."""
-        ret = {
-            "node": str(type(self).__name__),
-            "kid": str([x.to_dict() for x in self.kid if x]),
-            "line": str(self.loc.first_line),
-            "col": str(self.loc.col_start),
-        }
-        if isinstance(self, Token):
-            ret["name"] = self.name
-            ret["value"] = self.value
-        return ret
+        dicts: list[dict[str, str]] = []
+        stack: list[tuple[AstNode, bool]] = [(self, False)]
+        while stack:
+            node, kids_done = stack.pop()
+            if not kids_done:
+                stack.append((node, True))
+                stack.extend((x, False) for x in reversed(node.kid))
+                continue
+            kid_start = len(dicts) - len(node.kid)
+            ret = {
+                "node": node._node_name,
+                "kid": str(dicts[kid_start:]),
+                "line": str(node.loc.first_line),
+                "col": str(node.loc.col_start),
+            }
+            del dicts[kid_start:]
+            if isinstance(node, Token):
+                ret["name"] = node.name
+                ret["value"] = node.value
+            dicts.append(ret)
+        return dicts[0]
 
     def pp(self, depth: Optional[int] = None) -> str:
         """Print ast."""
@@ -261,6 +298,8 @@ class AstSymbolNode(AstNode):
 class AstSymbolStubNode(AstSymbolNode):
     """Nodes that have link to a symbol in symbol table."""
 
+    __slots__ = ()
+
     def __init__(self, sym_type: SymbolType) -> None:
         """Initialize ast."""
         AstSymbolNode.__init__(
@@ -274,9 +313,8 @@ class AstSymbolStubNode(AstSymbolNode):
 class AstAccessNode(AstNode):
     """Nodes that have access."""
 
-    def __init__(self, access: Optional[SubTag[Token]]) -> None:
-        """Initialize ast."""
-        self.access: Optional[SubTag[Token]] = access
+    # Set directly by each subclass __init__.
+    access: Optional[SubTag[Token]]
 
     @property
     def access_type(self) -> SymbolAccess:
@@ -346,26 +384,38 @@ class WalkerStmtOnlyNode(AstNode):
 class Expr(AstNode):
     """Expr node type for Jac Ast."""
 
+    __slots__ = ()
+
 
 class AtomExpr(Expr, AstSymbolStubNode):
     """AtomExpr node type for Jac Ast."""
 
+    __slots__ = ()
+
 
 class ElementStmt(AstDocNode):
     """ElementStmt node type for Jac Ast."""
 
+    __slots__ = ()
+
 
 class ArchBlockStmt(AstNode):
     """ArchBlockStmt node type for Jac Ast."""
 
+    __slots__ = ()
+
 
 class EnumBlockStmt(AstNode):
     """EnumBlockStmt node type for Jac Ast."""
 
+    __slots__ = ()
+
 
 class CodeBlockStmt(AstNode):
     """CodeBlockStmt node type for Jac Ast."""
 
+    __slots__ = ()
+
 
 class AstImplOnlyNode(CodeBlockStmt, ElementStmt, AstSymbolNode):
     """ImplOnly node type for Jac Ast."""
@@ -520,7 +570,7 @@ class NameAtom(AtomExpr, EnumBlockStmt):
             return SemTokType.VARIABLE, SemTokMod.READONLY
         if (
             self.sym
-            and self.sym.decl.name_of == self.sym.decl
+            and self.sym.decl.name_of is self.sym.decl
             and self.sym_name in dir(builtins)
             and callable(getattr(builtins, self.sym_name))
         ):
@@ -541,10 +591,14 @@ class ArchSpec(ElementStmt, CodeBlockStmt, AstSymbolNode, AstDocNode, AstSemStrN
 class MatchPattern(AstNode):
     """MatchPattern node type for Jac Ast."""
 
+    __slots__ = ()
+
 
 class SubTag(AstNode, Generic[T]):
     """SubTag node type for Jac Ast."""
 
+    __slots__ = ("tag",)
+
     def __init__(
         self,
         tag: T,
@@ -568,6 +622,8 @@ class SubTag(AstNode, Generic[T]):
 class SubNodeList(AstNode, Generic[T]):
     """SubNodeList node type for Jac Ast."""
 
+    __slots__ = ("items", "delim", "left_enc", "right_enc")
+
     def __init__(
         self,
         items: list[T],
@@ -609,6 +665,22 @@ class SubNodeList(AstNode, Generic[T]):
 class Module(AstDocNode):
     """Whole Program node type for Jac Ast."""
 
+    __slots__ = (
+        "name",
+        "source",
+        "body",
+        "is_imported",
+        "stub_only",
+        "impl_mod",
+        "test_mod",
+        "mod_deps",
+        "py_mod_dep_map",
+        "py_raise_map",
+        "registry",
+        "terminals",
+        "is_raised_from_py",
+    )
+
     def __init__(
         self,
         name: str,
@@ -691,6 +763,8 @@ class Module(AstDocNode):
 class GlobalVars(ElementStmt, AstAccessNode):
     """GlobalVars node type for Jac Ast."""
 
+    __slots__ = ("assignments", "is_frozen")
+
     def __init__(
         self,
         access: Optional[SubTag[Token]],
@@ -703,7 +777,7 @@ class GlobalVars(ElementStmt, AstAccessNode):
         self.assignments = assignments
         self.is_frozen = is_frozen
         AstNode.__init__(self, kid=kid)
-        AstAccessNode.__init__(self, access=access)
+        self.access = access
         AstDocNode.__init__(self, doc=doc)
 
     def normalize(self, deep: bool = False) -> bool:
@@ -730,6 +804,8 @@ class GlobalVars(ElementStmt, AstAccessNode):
 class Test(AstSymbolNode, ElementStmt):
     """Test node type for Jac Ast."""
 
+    __slots__ = ("name", "body")
+
     TEST_COUNT = 0
 
     def __init__(
@@ -794,6 +870,8 @@ class Test(AstSymbolNode, ElementStmt):
 class ModuleCode(ElementStmt, ArchBlockStmt, EnumBlockStmt):
     """Free mod code for Jac Ast."""
 
+    __slots__ = ("name", "body")
+
     def __init__(
         self,
         name: Optional[SubTag[Name]],
@@ -829,6 +907,8 @@ class ModuleCode(ElementStmt, ArchBlockStmt, EnumBlockStmt):
 class PyInlineCode(ElementStmt, ArchBlockStmt, EnumBlockStmt, CodeBlockStmt):
     """Inline Python code node type for Jac Ast."""
 
+    __slots__ = ("code",)
+
     def __init__(
         self,
         code: Token,
@@ -859,6 +939,8 @@ class PyInlineCode(ElementStmt, ArchBlockStmt, EnumBlockStmt, CodeBlockStmt):
 class Import(ElementStmt, CodeBlockStmt):
     """Import node type for Jac Ast."""
 
+    __slots__ = ("hint", "from_loc", "items", "is_absorb", "_jac_detected")
+
     def __init__(
         self,
         hint: Optional[SubTag[Name]],
@@ -873,6 +955,7 @@ class Import(ElementStmt, CodeBlockStmt):
         self.from_loc = from_loc
         self.items = items
         self.is_absorb = is_absorb
+        self._jac_detected: Optional[bool] = None
         AstNode.__init__(self, kid=kid)
         AstDocNode.__init__(self, doc=doc)
 
@@ -896,14 +979,19 @@ class Import(ElementStmt, CodeBlockStmt):
 
     @property
     def __jac_detected(self) -> bool:
-        """Check if import is jac."""
+        """Check if import is jac, resolving the paths only once."""
+        if self._jac_detected is None:
+            self._jac_detected = self.__detect_jac()
+        return self._jac_detected
+
+    def __detect_jac(self) -> bool:
+        """Detect if import is jac from the paths it resolves to."""
         if self.from_loc:
-            if self.from_loc.resolve_relative_path().endswith(".jac"):
+            from_path = self.from_loc.resolve_relative_path()
+            if from_path.endswith(".jac"):
                 return True
-            if os.path.isdir(self.from_loc.resolve_relative_path()):
-                if os.path.exists(
-                    os.path.join(self.from_loc.resolve_relative_path(), "__init__.jac")
-                ):
+            if os.path.isdir(from_path):
+                if os.path.exists(os.path.join(from_path, "__init__.jac")):
                     return True
                 for i in self.items.items:
                     if isinstance(
@@ -947,6 +1035,8 @@ class Import(ElementStmt, CodeBlockStmt):
 class ModulePath(AstSymbolNode):
     """ModulePath node type for Jac Ast."""
 
+    __slots__ = ("path", "level", "alias", "sub_module", "abs_path")
+
     def __init__(
         self,
         path: Optional[list[Name]],
@@ -1035,6 +1125,8 @@ class ModulePath(AstSymbolNode):
 class ModuleItem(AstSymbolNode):
     """ModuleItem node type for Jac Ast."""
 
+    __slots__ = ("name", "alias", "sub_module", "abs_path")
+
     def __init__(
         self,
         name: Name,
@@ -1089,6 +1181,8 @@ class ModuleItem(AstSymbolNode):
 class Architype(ArchSpec, AstAccessNode, ArchBlockStmt, AstImplNeedingNode):
     """ObjectArch node type for Jac Ast."""
 
+    __slots__ = ("name", "arch_type", "base_classes")
+
     def __init__(
         self,
         name: Name,
@@ -1129,7 +1223,7 @@ class Architype(ArchSpec, AstAccessNode, ArchBlockStmt, AstImplNeedingNode):
             ),
         )
         AstImplNeedingNode.__init__(self, body=body)
-        AstAccessNode.__init__(self, access=access)
+        self.access = access
         AstDocNode.__init__(self, doc=doc)
         AstSemStrNode.__init__(self, semstr=semstr)
         ArchSpec.__init__(self, decorators=decorators)
@@ -1188,6 +1282,8 @@ class Architype(ArchSpec, AstAccessNode, ArchBlockStmt, AstImplNeedingNode):
 class ArchDef(AstImplOnlyNode):
     """ArchDef node type for Jac Ast."""
 
+    __slots__ = ()
+
     def __init__(
         self,
         target: ArchRefChain,
@@ -1220,6 +1316,8 @@ class ArchDef(AstImplOnlyNode):
 class Enum(ArchSpec, AstAccessNode, AstImplNeedingNode, ArchBlockStmt):
     """Enum node type for Jac Ast."""
 
+    __slots__ = ("name", "base_classes")
+
     def __init__(
         self,
         name: Name,
@@ -1242,7 +1340,7 @@ class Enum(ArchSpec, AstAccessNode, AstImplNeedingNode, ArchBlockStmt):
             sym_category=SymbolType.ENUM_ARCH,
         )
         AstImplNeedingNode.__init__(self, body=body)
-        AstAccessNode.__init__(self, access=access)
+        self.access = access
         AstDocNode.__init__(self, doc=doc)
         AstSemStrNode.__init__(self, semstr=semstr)
         ArchSpec.__init__(self, decorators=decorators)
@@ -1289,6 +1387,8 @@ class Enum(ArchSpec, AstAccessNode, AstImplNeedingNode, ArchBlockStmt):
 class EnumDef(AstImplOnlyNode):
     """EnumDef node type for Jac Ast."""
 
+    __slots__ = ()
+
     def __init__(
         self,
         target: ArchRefChain,
@@ -1333,6 +1433,15 @@ class Ability(
 ):
     """Ability node type for Jac Ast."""
 
+    __slots__ = (
+        "name_ref",
+        "is_override",
+        "is_static",
+        "is_abstract",
+        "decorators",
+        "signature",
+    )
+
     def __init__(
         self,
         name_ref: NameAtom,
@@ -1364,7 +1473,7 @@ class Ability(
             name_spec=name_ref,
             sym_category=SymbolType.ABILITY,
         )
-        AstAccessNode.__init__(self, access=access)
+        self.access = access
         AstDocNode.__init__(self, doc=doc)
         AstAsyncNode.__init__(self, is_async=is_async)
 
@@ -1450,6 +1559,8 @@ class Ability(
 class AbilityDef(AstImplOnlyNode):
     """AbilityDef node type for Jac Ast."""
 
+    __slots__ = ("signature", "decorators")
+
     def __init__(
         self,
         target: ArchRefChain,
@@ -1491,6 +1602,8 @@ class AbilityDef(AstImplOnlyNode):
 class FuncSignature(AstSemStrNode):
     """FuncSignature node type for Jac Ast."""
 
+    __slots__ = ("params", "return_type", "is_method")
+
     def __init__(
         self,
         params: Optional[SubNodeList[ParamVar]],
@@ -1555,6 +1668,8 @@ class FuncSignature(AstSemStrNode):
 class EventSignature(AstSemStrNode):
     """EventSignature node type for Jac Ast."""
 
+    __slots__ = ("event", "arch_tag_info", "return_type", "is_method")
+
     def __init__(
         self,
         event: Token,
@@ -1599,6 +1714,8 @@ class EventSignature(AstSemStrNode):
 class ArchRefChain(AstNode):
     """Arch ref list node type for Jac Ast."""
 
+    __slots__ = ("archs",)
+
     def __init__(
         self,
         archs: list[ArchRef],
@@ -1642,6 +1759,8 @@ class ArchRefChain(AstNode):
 class ParamVar(AstSymbolNode, AstTypedVarNode, AstSemStrNode):
     """ParamVar node type for Jac Ast."""
 
+    __slots__ = ("name", "unpack", "value")
+
     def __init__(
         self,
         name: Name,
@@ -1693,6 +1812,8 @@ class ParamVar(AstSymbolNode, AstTypedVarNode, AstSemStrNode):
 class ArchHas(AstAccessNode, AstDocNode, ArchBlockStmt):
     """HasStmt node type for Jac Ast."""
 
+    __slots__ = ("is_static", "vars", "is_frozen")
+
     def __init__(
         self,
         is_static: bool,
@@ -1707,7 +1828,7 @@ class ArchHas(AstAccessNode, AstDocNode, ArchBlockStmt):
         self.vars = vars
         self.is_frozen = is_frozen
         AstNode.__init__(self, kid=kid)
-        AstAccessNode.__init__(self, access=access)
+        self.access = access
         AstDocNode.__init__(self, doc=doc)
 
     def normalize(self, deep: bool = False) -> bool:
@@ -1738,6 +1859,8 @@ class ArchHas(AstAccessNode, AstDocNode, ArchBlockStmt):
 class HasVar(AstSymbolNode, AstTypedVarNode, AstSemStrNode):
     """HasVar node type for Jac Ast."""
 
+    __slots__ = ("name", "value", "defer")
+
     def __init__(
         self,
         name: Name,
@@ -1788,6 +1911,8 @@ class HasVar(AstSymbolNode, AstTypedVarNode, AstSemStrNode):
 class TypedCtxBlock(CodeBlockStmt):
     """TypedCtxBlock node type for Jac Ast."""
 
+    __slots__ = ("type_ctx", "body")
+
     def __init__(
         self,
         type_ctx: Expr,
@@ -1817,6 +1942,8 @@ class TypedCtxBlock(CodeBlockStmt):
 class IfStmt(CodeBlockStmt, AstElseBodyNode):
     """IfStmt node type for Jac Ast."""
 
+    __slots__ = ("condition", "body")
+
     def __init__(
         self,
         condition: Expr,
@@ -1851,6 +1978,8 @@ class IfStmt(CodeBlockStmt, AstElseBodyNode):
 class ElseIf(IfStmt):
     """ElseIfs node type for Jac Ast."""
 
+    __slots__ = ()
+
     def normalize(self, deep: bool = False) -> bool:
         """Normalize else if statement node."""
         res = True
@@ -1872,6 +2001,8 @@ class ElseIf(IfStmt):
 class ElseStmt(AstNode):
     """Else node type for Jac Ast."""
 
+    __slots__ = ("body",)
+
     def __init__(
         self,
         body: SubNodeList[CodeBlockStmt],
@@ -1897,6 +2028,8 @@ class ElseStmt(AstNode):
 class ExprStmt(CodeBlockStmt):
     """ExprStmt node type for Jac Ast."""
 
+    __slots__ = ("expr", "in_fstring")
+
     def __init__(
         self,
         expr: Expr,
@@ -1925,6 +2058,8 @@ class ExprStmt(CodeBlockStmt):
 class TryStmt(AstElseBodyNode, CodeBlockStmt):
     """TryStmt node type for Jac Ast."""
 
+    __slots__ = ("body", "excepts", "finally_body")
+
     def __init__(
         self,
         body: SubNodeList[CodeBlockStmt],
@@ -1967,6 +2102,8 @@ class TryStmt(AstElseBodyNode, CodeBlockStmt):
 class Except(CodeBlockStmt):
     """Except node type for Jac Ast."""
 
+    __slots__ = ("ex_type", "name", "body")
+
     def __init__(
         self,
         ex_type: Expr,
@@ -2002,6 +2139,8 @@ class Except(CodeBlockStmt):
 class FinallyStmt(CodeBlockStmt):
     """FinallyStmt node type for Jac Ast."""
 
+    __slots__ = ("body",)
+
     def __init__(
         self,
         body: SubNodeList[CodeBlockStmt],
@@ -2027,6 +2166,8 @@ class FinallyStmt(CodeBlockStmt):
 class IterForStmt(AstAsyncNode, AstElseBodyNode, CodeBlockStmt):
     """IterFor node type for Jac Ast."""
 
+    __slots__ = ("iter", "condition", "count_by", "body")
+
     def __init__(
         self,
         iter: Assignment,
@@ -2074,6 +2215,8 @@ class IterForStmt(AstAsyncNode, AstElseBodyNode, CodeBlockStmt):
 class InForStmt(AstAsyncNode, AstElseBodyNode, CodeBlockStmt):
     """InFor node type for Jac Ast."""
 
+    __slots__ = ("target", "collection", "body")
+
     def __init__(
         self,
         target: Expr,
@@ -2118,6 +2261,8 @@ class InForStmt(AstAsyncNode, AstElseBodyNode, CodeBlockStmt):
 class WhileStmt(CodeBlockStmt):
     """WhileStmt node type for Jac Ast."""
 
+    __slots__ = ("condition", "body")
+
     def __init__(
         self,
         condition: Expr,
@@ -2148,6 +2293,8 @@ class WhileStmt(CodeBlockStmt):
 class WithStmt(AstAsyncNode, CodeBlockStmt):
     """WithStmt node type for Jac Ast."""
 
+    __slots__ = ("exprs", "body")
+
     def __init__(
         self,
         is_async: bool,
@@ -2183,6 +2330,8 @@ class WithStmt(AstAsyncNode, CodeBlockStmt):
 class ExprAsItem(AstNode):
     """ExprAsItem node type for Jac Ast."""
 
+    __slots__ = ("expr", "alias")
+
     def __init__(
         self,
         expr: Expr,
@@ -2211,6 +2360,8 @@ class ExprAsItem(AstNode):
 class RaiseStmt(CodeBlockStmt):
     """RaiseStmt node type for Jac Ast."""
 
+    __slots__ = ("cause", "from_target")
+
     def __init__(
         self,
         cause: Optional[Expr],
@@ -2242,6 +2393,8 @@ class RaiseStmt(CodeBlockStmt):
 class AssertStmt(CodeBlockStmt):
     """AssertStmt node type for Jac Ast."""
 
+    __slots__ = ("condition", "error_msg")
+
     def __init__(
         self,
         condition: Expr,
@@ -2274,6 +2427,8 @@ class AssertStmt(CodeBlockStmt):
 class CheckStmt(CodeBlockStmt):
     """DeleteStmt node type for Jac Ast."""
 
+    __slots__ = ("target",)
+
     def __init__(
         self,
         target: Expr,
@@ -2300,6 +2455,8 @@ class CheckStmt(CodeBlockStmt):
 class CtrlStmt(CodeBlockStmt):
     """CtrlStmt node type for Jac Ast."""
 
+    __slots__ = ("ctrl",)
+
     def __init__(
         self,
         ctrl: Token,
@@ -2322,6 +2479,8 @@ class CtrlStmt(CodeBlockStmt):
 class DeleteStmt(CodeBlockStmt):
     """DeleteStmt node type for Jac Ast."""
 
+    __slots__ = ("target",)
+
     def __init__(
         self,
         target: Expr,
@@ -2348,6 +2507,8 @@ class DeleteStmt(CodeBlockStmt):
 class ReportStmt(CodeBlockStmt):
     """ReportStmt node type for Jac Ast."""
 
+    __slots__ = ("expr",)
+
     def __init__(
         self,
         expr: Expr,
@@ -2374,6 +2535,8 @@ class ReportStmt(CodeBlockStmt):
 class ReturnStmt(CodeBlockStmt):
     """ReturnStmt node type for Jac Ast."""
 
+    __slots__ = ("expr",)
+
     def __init__(
         self,
         expr: Optional[Expr],
@@ -2401,6 +2564,8 @@ class ReturnStmt(CodeBlockStmt):
 class IgnoreStmt(WalkerStmtOnlyNode, CodeBlockStmt):
     """IgnoreStmt node type for Jac Ast."""
 
+    __slots__ = ("target",)
+
     def __init__(
         self,
         target: Expr,
@@ -2428,6 +2593,8 @@ class IgnoreStmt(WalkerStmtOnlyNode, CodeBlockStmt):
 class VisitStmt(WalkerStmtOnlyNode, AstElseBodyNode, CodeBlockStmt):
     """VisitStmt node type for Jac Ast."""
 
+    __slots__ = ("vis_type", "target")
+
     def __init__(
         self,
         vis_type: Optional[SubNodeList[Expr]],
@@ -2467,6 +2634,8 @@ class VisitStmt(WalkerStmtOnlyNode, AstElseBodyNode, CodeBlockStmt):
 class RevisitStmt(WalkerStmtOnlyNode, AstElseBodyNode, CodeBlockStmt):
     """ReVisitStmt node type for Jac Ast."""
 
+    __slots__ = ("hops",)
+
     def __init__(
         self,
         hops: Optional[Expr],
@@ -2498,6 +2667,8 @@ class RevisitStmt(WalkerStmtOnlyNode, AstElseBodyNode, CodeBlockStmt):
 class DisengageStmt(WalkerStmtOnlyNode, CodeBlockStmt):
     """DisengageStmt node type for Jac Ast."""
 
+    __slots__ = ()
+
     def __init__(
         self,
         kid: Sequence[AstNode],
@@ -2519,6 +2690,8 @@ class DisengageStmt(WalkerStmtOnlyNode, CodeBlockStmt):
 class AwaitExpr(Expr):
     """AwaitStmt node type for Jac Ast."""
 
+    __slots__ = ("target",)
+
     def __init__(
         self,
         target: Expr,
@@ -2544,6 +2717,8 @@ class AwaitExpr(Expr):
 class GlobalStmt(CodeBlockStmt):
     """GlobalStmt node type for Jac Ast."""
 
+    __slots__ = ("target",)
+
     def __init__(
         self,
         target: SubNodeList[NameAtom],
@@ -2570,6 +2745,8 @@ class GlobalStmt(CodeBlockStmt):
 class NonLocalStmt(GlobalStmt):
     """NonlocalStmt node type for Jac Ast."""
 
+    __slots__ = ()
+
     def normalize(self, deep: bool = False) -> bool:
         """Normalize nonlocal statement node."""
         res = True
@@ -2587,6 +2764,8 @@ class NonLocalStmt(GlobalStmt):
 class Assignment(AstSemStrNode, AstTypedVarNode, EnumBlockStmt, CodeBlockStmt):
     """Assignment node type for Jac Ast."""
 
+    __slots__ = ("target", "value", "mutable", "aug_op", "is_enum_stmt")
+
     def __init__(
         self,
         target: SubNodeList[Expr],
@@ -2632,7 +2811,7 @@ class Assignment(AstSemStrNode, AstTypedVarNode, EnumBlockStmt, CodeBlockStmt):
         if isinstance(self.parent, SubNodeList) and isinstance(
             self.parent.parent, GlobalVars
         ):
-            if self.parent.kid.index(self) == len(self.parent.kid) - 1:
+            if self.parent.kid[-1] is self:
                 new_kid.append(self.gen_token(Tok.SEMI))
         elif (not self.is_enum_stmt) and not isinstance(self.parent, IterForStmt):
             new_kid.append(self.gen_token(Tok.SEMI))
@@ -2643,6 +2822,8 @@ class Assignment(AstSemStrNode, AstTypedVarNode, EnumBlockStmt, CodeBlockStmt):
 class BinaryExpr(Expr):
     """ExprBinary node type for Jac Ast."""
 
+    __slots__ = ("left", "right", "op")
+
     def __init__(
         self,
         left: Expr,
@@ -2677,6 +2858,8 @@ class BinaryExpr(Expr):
 class CompareExpr(Expr):
     """CompareExpr node type for Jac Ast."""
 
+    __slots__ = ("left", "rights", "ops")
+
     def __init__(
         self,
         left: Expr,
@@ -2710,6 +2893,8 @@ class CompareExpr(Expr):
 class BoolExpr(Expr):
     """BoolExpr node type for Jac Ast."""
 
+    __slots__ = ("values", "op")
+
     def __init__(
         self,
         op: Token,
@@ -2740,6 +2925,8 @@ class BoolExpr(Expr):
 class LambdaExpr(Expr):
     """ExprLambda node type for Jac Ast."""
 
+    __slots__ = ("signature", "body")
+
     def __init__(
         self,
         body: Expr,
@@ -2772,6 +2959,8 @@ class LambdaExpr(Expr):
 class UnaryExpr(Expr):
     """ExprUnary node type for Jac Ast."""
 
+    __slots__ = ("operand", "op")
+
     def __init__(
         self,
         operand: Expr,
@@ -2797,6 +2986,8 @@ class UnaryExpr(Expr):
 class IfElseExpr(Expr):
     """ExprIfElse node type for Jac Ast."""
 
+    __slots__ = ("condition", "value", "else_value")
+
     def __init__(
         self,
         condition: Expr,
@@ -2831,6 +3022,8 @@ class IfElseExpr(Expr):
 class MultiString(AtomExpr):
     """ExprMultiString node type for Jac Ast."""
 
+    __slots__ = ("strings",)
+
     def __init__(
         self,
         strings: Sequence[String | FString],
@@ -2857,6 +3050,8 @@ class MultiString(AtomExpr):
 class FString(AtomExpr):
     """FString node type for Jac Ast."""
 
+    __slots__ = ("parts",)
+
     def __init__(
         self,
         parts: Optional[SubNodeList[String | ExprStmt]],
@@ -2887,6 +3082,8 @@ class FString(AtomExpr):
 class ListVal(AtomExpr):
     """ListVal node type for Jac Ast."""
 
+    __slots__ = ("values",)
+
     def __init__(
         self,
         values: Optional[SubNodeList[Expr]],
@@ -2915,6 +3112,8 @@ class ListVal(AtomExpr):
 class SetVal(AtomExpr):
     """SetVal node type for Jac Ast."""
 
+    __slots__ = ("values",)
+
     def __init__(
         self,
         values: Optional[SubNodeList[Expr]],
@@ -2943,6 +3142,8 @@ class SetVal(AtomExpr):
 class TupleVal(AtomExpr):
     """TupleVal node type for Jac Ast."""
 
+    __slots__ = ("values",)
+
     def __init__(
         self,
         values: Optional[SubNodeList[Expr | KWPair]],
@@ -2986,6 +3187,8 @@ class TupleVal(AtomExpr):
 class DictVal(AtomExpr):
     """ExprDict node type for Jac Ast."""
 
+    __slots__ = ("kv_pairs",)
+
     def __init__(
         self,
         kv_pairs: Sequence[KVPair],
@@ -3017,6 +3220,8 @@ class DictVal(AtomExpr):
 class KVPair(AstNode):
     """ExprKVPair node type for Jac Ast."""
 
+    __slots__ = ("key", "value")
+
     def __init__(
         self,
         key: Optional[Expr],  # is **key if blank
@@ -3048,6 +3253,8 @@ class KVPair(AstNode):
 class KWPair(AstNode):
     """ExprKWPair node type for Jac Ast."""
 
+    __slots__ = ("key", "value")
+
     def __init__(
         self,
         key: Optional[NameAtom],  # is **value if blank
@@ -3077,6 +3284,8 @@ class KWPair(AstNode):
 class InnerCompr(AstAsyncNode):
     """ListCompr node type for Jac Ast."""
 
+    __slots__ = ("target", "collection", "conditional")
+
     def __init__(
         self,
         is_async: bool,
@@ -3117,6 +3326,8 @@ class InnerCompr(AstAsyncNode):
 class ListCompr(AtomExpr):
     """ListCompr node type for Jac Ast."""
 
+    __slots__ = ("out_expr", "compr")
+
     def __init__(
         self,
         out_expr: Expr,
@@ -3150,6 +3361,8 @@ class ListCompr(AtomExpr):
 class GenCompr(ListCompr):
     """GenCompr node type for Jac Ast."""
 
+    __slots__ = ()
+
     def normalize(self, deep: bool = False) -> bool:
         """Normalize ast node."""
         res = True
@@ -3171,6 +3384,8 @@ class GenCompr(ListCompr):
 class SetCompr(ListCompr):
     """SetCompr node type for Jac Ast."""
 
+    __slots__ = ()
+
     def normalize(self, deep: bool = False) -> bool:
         """Normalize ast node."""
         res = True
@@ -3192,6 +3407,8 @@ class SetCompr(ListCompr):
 class DictCompr(AtomExpr):
     """DictCompr node type for Jac Ast."""
 
+    __slots__ = ("kv_pair", "compr")
+
     def __init__(
         self,
         kv_pair: KVPair,
@@ -3224,6 +3441,8 @@ class DictCompr(AtomExpr):
 class AtomTrailer(Expr):
     """AtomTrailer node type for Jac Ast."""
 
+    __slots__ = ("target", "right", "is_attr", "is_null_ok", "is_genai")
+
     def __init__(
         self,
         target: Expr,
@@ -3277,6 +3496,8 @@ class AtomTrailer(Expr):
 class AtomUnit(Expr):
     """AtomUnit node type for Jac Ast."""
 
+    __slots__ = ("value",)
+
     def __init__(
         self,
         value: Expr | YieldExpr,
@@ -3302,6 +3523,8 @@ class AtomUnit(Expr):
 class YieldExpr(Expr):
     """YieldStmt node type for Jac Ast."""
 
+    __slots__ = ("expr", "with_from")
+
     def __init__(
         self,
         expr: Optional[Expr],
@@ -3331,6 +3554,8 @@ class YieldExpr(Expr):
 class FuncCall(Expr):
     """FuncCall node type for Jac Ast."""
 
+    __slots__ = ("target", "params", "genai_call")
+
     def __init__(
         self,
         target: Expr,
@@ -3363,6 +3588,8 @@ class FuncCall(Expr):
 class IndexSlice(AtomExpr):
     """IndexSlice node type for Jac Ast."""
 
+    __slots__ = ("start", "stop", "step", "is_range")
+
     def __init__(
         self,
         start: Optional[Expr],
@@ -3409,6 +3636,8 @@ class IndexSlice(AtomExpr):
 class ArchRef(AtomExpr):
     """ArchRef node type for Jac Ast."""
 
+    __slots__ = ("arch_name", "arch_type")
+
     def __init__(
         self,
         arch_name: NameAtom,
@@ -3439,6 +3668,8 @@ class ArchRef(AtomExpr):
 class EdgeRefTrailer(Expr):
     """EdgeRefTrailer node type for Jac Ast."""
 
+    __slots__ = ("chain", "edges_only")
+
     def __init__(
         self,
         chain: list[Expr | FilterCompr],
@@ -3468,6 +3699,8 @@ class EdgeRefTrailer(Expr):
 class EdgeOpRef(WalkerStmtOnlyNode, AtomExpr):
     """EdgeOpRef node type for Jac Ast."""
 
+    __slots__ = ("filter_cond", "edge_dir")
+
     def __init__(
         self,
         filter_cond: Optional[FilterCompr],
@@ -3515,6 +3748,8 @@ class EdgeOpRef(WalkerStmtOnlyNode, AtomExpr):
 class DisconnectOp(WalkerStmtOnlyNode):
     """DisconnectOpRef node type for Jac Ast."""
 
+    __slots__ = ("edge_spec",)
+
     def __init__(
         self,
         edge_spec: EdgeOpRef,
@@ -3538,6 +3773,8 @@ class DisconnectOp(WalkerStmtOnlyNode):
 class ConnectOp(AstNode):
     """ConnectOpRef node type for Jac Ast."""
 
+    __slots__ = ("conn_type", "conn_assign", "edge_dir")
+
     def __init__(
         self,
         conn_type: Optional[Expr],
@@ -3598,6 +3835,8 @@ class ConnectOp(AstNode):
 class FilterCompr(AtomExpr):
     """FilterCtx node type for Jac Ast."""
 
+    __slots__ = ("f_type", "compares")
+
     def __init__(
         self,
         f_type: Optional[Expr],
@@ -3637,6 +3876,8 @@ class FilterCompr(AtomExpr):
 class AssignCompr(AtomExpr):
     """AssignCtx node type for Jac Ast."""
 
+    __slots__ = ("assigns",)
+
     def __init__(
         self,
         assigns: SubNodeList[KWPair],
@@ -3671,6 +3912,8 @@ class AssignCompr(AtomExpr):
 class MatchStmt(CodeBlockStmt):
     """MatchStmt node type for Jac Ast."""
 
+    __slots__ = ("target", "cases")
+
     def __init__(
         self,
         target: Expr,
@@ -3705,6 +3948,8 @@ class MatchStmt(CodeBlockStmt):
 class MatchCase(AstNode):
     """MatchCase node type for Jac Ast."""
 
+    __slots__ = ("pattern", "guard", "body")
+
     def __init__(
         self,
         pattern: MatchPattern,
@@ -3740,6 +3985,8 @@ class MatchCase(AstNode):
 class MatchOr(MatchPattern):
     """MatchOr node type for Jac Ast."""
 
+    __slots__ = ("patterns",)
+
     def __init__(
         self,
         patterns: list[MatchPattern],
@@ -3767,6 +4014,8 @@ class MatchOr(MatchPattern):
 class MatchAs(MatchPattern):
     """MatchAs node type for Jac Ast."""
 
+    __slots__ = ("name", "pattern")
+
     def __init__(
         self,
         name: NameAtom,
@@ -3796,6 +4045,8 @@ class MatchAs(MatchPattern):
 class MatchWild(MatchPattern):
     """Match wild card node type for Jac Ast."""
 
+    __slots__ = ()
+
     def normalize(self, deep: bool = False) -> bool:
         """Normalize match wild card node."""
         AstNode.set_kids(
@@ -3820,6 +4071,8 @@ class MatchWild(MatchPattern):
 class MatchValue(MatchPattern):
     """MatchValue node type for Jac Ast."""
 
+    __slots__ = ("value",)
+
     def __init__(
         self,
         value: Expr,
@@ -3841,6 +4094,8 @@ class MatchValue(MatchPattern):
 class MatchSingleton(MatchPattern):
     """MatchSingleton node type for Jac Ast."""
 
+    __slots__ = ("value",)
+
     def __init__(
         self,
         value: Bool | Null,
@@ -3860,6 +4115,8 @@ class MatchSingleton(MatchPattern):
 class MatchSequence(MatchPattern):
     """MatchSequence node type for Jac Ast."""
 
+    __slots__ = ("values",)
+
     def __init__(
         self,
         values: list[MatchPattern],
@@ -3888,6 +4145,8 @@ class MatchSequence(MatchPattern):
 class MatchMapping(MatchPattern):
     """MatchMapping node type for Jac Ast."""
 
+    __slots__ = ("values",)
+
     def __init__(
         self,
         values: list[MatchKVPair | MatchStar],
@@ -3916,6 +4175,8 @@ class MatchMapping(MatchPattern):
 class MatchKVPair(MatchPattern):
     """MatchKVPair node type for Jac Ast."""
 
+    __slots__ = ("key", "value")
+
     def __init__(
         self,
         key: MatchPattern | NameAtom,
@@ -3944,6 +4205,8 @@ class MatchKVPair(MatchPattern):
 class MatchStar(MatchPattern):
     """MatchStar node type for Jac Ast."""
 
+    __slots__ = ("name", "is_list")
+
     def __init__(
         self,
         name: NameAtom,
@@ -3971,6 +4234,8 @@ class MatchStar(MatchPattern):
 class MatchArch(MatchPattern):
     """MatchClass node type for Jac Ast."""
 
+    __slots__ = ("name", "arg_patterns", "kw_patterns")
+
     def __init__(
         self,
         name: AtomTrailer | NameAtom,
@@ -4010,6 +4275,18 @@ class MatchArch(MatchPattern):
 class Token(AstNode):
     """Token node type for Jac Ast."""
 
+    __slots__ = (
+        "file_path",
+        "name",
+        "value",
+        "line_no",
+        "end_line",
+        "c_start",
+        "c_end",
+        "pos_start",
+        "pos_end",
+    )
+
     def __init__(
         self,
         file_path: str,
@@ -4046,6 +4323,8 @@ class Token(AstNode):
 class Name(Token, NameAtom):
     """Name node type for Jac Ast."""
 
+    __slots__ = ("is_enum_singleton", "is_kwesc")
+
     def __init__(
         self,
         file_path: str,
@@ -4115,6 +4394,8 @@ class Name(Token, NameAtom):
 class SpecialVarRef(Name):
     """HereRef node type for Jac Ast."""
 
+    __slots__ = ("orig",)
+
     def __init__(
         self,
         var: Name,
@@ -4162,6 +4443,8 @@ class SpecialVarRef(Name):
 class Literal(Token, AtomExpr):
     """Literal node type for Jac Ast."""
 
+    __slots__ = ()
+
     SYMBOL_TYPE = SymbolType.VAR
 
     type_map = {
@@ -4215,6 +4498,8 @@ class Literal(Token, AtomExpr):
 class BuiltinType(Name, Literal, NameAtom):
     """Type node type for Jac Ast."""
 
+    __slots__ = ()
+
     SYMBOL_TYPE = SymbolType.VAR
 
     @property
@@ -4228,6 +4513,8 @@ class BuiltinType(Name, Literal, NameAtom):
 class Float(Literal):
     """Float node type for Jac Ast."""
 
+    __slots__ = ()
+
     SYMBOL_TYPE = SymbolType.NUMBER
 
     @property
@@ -4239,6 +4526,8 @@ class Float(Literal):
 class Int(Literal):
     """Int node type for Jac Ast."""
 
+    __slots__ = ()
+
     SYMBOL_TYPE = SymbolType.NUMBER
 
     @property
@@ -4250,6 +4539,8 @@ class Int(Literal):
 class String(Literal):
     """String node type for Jac Ast."""
 
+    __slots__ = ()
+
     SYMBOL_TYPE = SymbolType.STRING
 
     @property
@@ -4285,6 +4576,8 @@ class String(Literal):
 class Bool(Literal):
     """Bool node type for Jac Ast."""
 
+    __slots__ = ()
+
     SYMBOL_TYPE = SymbolType.BOOL
 
     @property
@@ -4296,6 +4589,8 @@ class Bool(Literal):
 class Null(Literal):
     """Semicolon node type for Jac Ast."""
 
+    __slots__ = ()
+
     SYMBOL_TYPE = SymbolType.NULL
 
     @property
@@ -4307,6 +4602,8 @@ class Null(Literal):
 class Ellipsis(Literal):
     """Ellipsis node type for Jac Ast."""
 
+    __slots__ = ()
+
     SYMBOL_TYPE = SymbolType.NULL
 
     @property
@@ -4318,6 +4615,8 @@ class Ellipsis(Literal):
 class EmptyToken(Token):
     """EmptyToken node type for Jac Ast."""
 
+    __slots__ = ()
+
     def __init__(self, file_path: str = "") -> None:
         """Initialize empty token."""
         super().__init__(
@@ -4336,10 +4635,14 @@ class EmptyToken(Token):
 class Semi(Token, CodeBlockStmt):
     """Semicolon node type for Jac Ast."""
 
+    __slots__ = ()
+
 
 class CommentToken(Token):
     """CommentToken node type for Jac Ast."""
 
+    __slots__ = ("is_inline",)
+
     def __init__(
         self,
         file_path: str,
@@ -4377,6 +4680,8 @@ class CommentToken(Token):
 class JacSource(EmptyToken):
     """SourceString node type for Jac Ast."""
 
+    __slots__ = ("hash", "comments")
+
     def __init__(self, source: str, mod_path: str) -> None:
         """Initialize source string."""
         super().__init__()
@@ -4394,6 +4699,8 @@ class JacSource(EmptyToken):
 class PythonModuleAst(EmptyToken):
     """SourceString node type for Jac Ast."""
 
+    __slots__ = ("ast",)
+
     def __init__(self, ast: ast3.Module, mod_path: str) -> None:
         """Initialize source string."""
         super().__init__()
@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
+import gc
 import keyword
 import logging
 import os
+import sys
 from typing import Callable, TypeAlias
 
 
@@ -25,12 +27,17 @@ class JacParser(Pass):
         self.source = input_ir
         self.mod_path = input_ir.loc.mod_path
         self.node_list: list[ast.AstNode] = []
+        self.node_set: set[ast.AstNode] = set()
         if JacParser.dev_mode:
             JacParser.make_dev()
         Pass.__init__(self, input_ir=input_ir, prior=None)
 
     def transform(self, ir: ast.AstNode) -> ast.Module:
         """Transform input IR."""
+        # The parse tree and AST are all live until parsing ends, so cyclic GC
+        # passes over them while they are being built find nothing to free.
+        gc_enabled = gc.isenabled()
+        gc.disable()
         try:
             tree, comments = JacParser.parse(
                 self.source.value, on_error=self.error_callback
@@ -51,6 +58,9 @@ class JacParser(Pass):
             self.error(f"Syntax Error: {e}", node_override=catch_error)
         except Exception as e:
             self.error(f"Internal Error: {e}")
+        finally:
+            if gc_enabled:
+                gc.enable()
         return ast.Module(
             name="",
             source=self.source,
@@ -133,7 +143,8 @@ class JacParser(Pass):
         def nu(self, node: ast.T) -> ast.T:
             """Update node."""
             self.parse_ref.cur_node = node
-            if node not in self.parse_ref.node_list:
+            if node not in self.parse_ref.node_set:
+                self.parse_ref.node_set.add(node)
                 self.parse_ref.node_list.append(node)
             return node
 
@@ -2837,7 +2848,7 @@ class JacParser(Pass):
                 chomp = chomp[2:]
             expr_list = []
             if len(chomp):
-                expr_list = chomp[0].kid
+                expr_list = [*chomp[0].kid]
                 chomp = chomp[1:]
                 if len(chomp):
                     chomp = chomp[1:]
@@ -3983,10 +3994,15 @@ class JacParser(Pass):
                 ret_type = ast.Bool
             elif token.type == Tok.PYNLINE and isinstance(token.value, str):
                 token.value = token.value.replace("::py::", "")
+            value = token.value[2:] if token.type == Tok.KWESC_NAME else token.value
+            if ret_type is ast.Name or ret_type is ast.Token:
+                # Names, keywords and operators repeat throughout a module, so
+                # share one string per spelling instead of one per occurrence.
+                value = sys.intern(value)
             ret = ret_type(
                 file_path=self.parse_ref.mod_path,
-                name=token.type,
-                value=token.value[2:] if token.type == Tok.KWESC_NAME else token.value,
+                name=sys.intern(token.type),
+                value=value,
                 line=token.line if token.line is not None else 0,
                 end_line=token.end_line if token.end_line is not None else 0,
                 col_start=token.column if token.column is not None else 0,
@@ -3997,7 +4013,7 @@ class JacParser(Pass):
             if isinstance(ret, ast.Name):
                 if token.type == Tok.KWESC_NAME:
                     ret.is_kwesc = True
-                if ret.value in keyword.kwlist:
+                if keyword.iskeyword(ret.value):
                     err = jl.UnexpectedInput(f"Python keyword {ret.value} used as name")
                     err.line = ret.loc.first_line
                     err.column = ret.loc.col_start
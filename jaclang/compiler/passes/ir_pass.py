@@ -1,7 +1,7 @@
 """Abstract class for IR Passes for Jac."""
 
 import time
-from typing import Optional, Type, TypeVar
+from typing import Callable, ClassVar, Iterator, Optional, Type, TypeVar
 
 import jaclang.compiler.absyntree as ast
 from jaclang.compiler.passes.transform import Transform
@@ -14,6 +14,26 @@ T = TypeVar("T", bound=ast.AstNode)
 class Pass(Transform[T]):
     """Abstract class for IR passes."""
 
+    _enter_hooks: ClassVar[dict[type, Optional[Callable]]] = {}
+    _exit_hooks: ClassVar[dict[type, Optional[Callable]]] = {}
+
+    def __init_subclass__(cls) -> None:
+        """Give each pass class its own hook lookup tables."""
+        super().__init_subclass__()
+        cls._enter_hooks = {}
+        cls._exit_hooks = {}
+
+    @classmethod
+    def get_hook(
+        cls, hooks: dict[type, Optional[Callable]], prefix: str, node_type: type
+    ) -> Optional[Callable]:
+        """Get the enter/exit method of this pass for a node type, if any."""
+        if node_type not in hooks:
+            hooks[node_type] = getattr(
+                cls, f"{prefix}_{pascal_to_snake(node_type.__name__)}", None
+            )
+        return hooks[node_type]
+
     def __init__(self, input_ir: T, prior: Optional[Transform]) -> None:
         """Initialize parser."""
         self.term_signal = False
@@ -32,13 +52,13 @@ class Pass(Transform[T]):
 
     def enter_node(self, node: ast.AstNode) -> None:
         """Run on entering node."""
-        if hasattr(self, f"enter_{pascal_to_snake(type(node).__name__)}"):
-            getattr(self, f"enter_{pascal_to_snake(type(node).__name__)}")(node)
+        if hook := self.get_hook(self._enter_hooks, "enter", type(node)):
+            hook(self, node)
 
     def exit_node(self, node: ast.AstNode) -> None:
         """Run on exiting node."""
-        if hasattr(self, f"exit_{pascal_to_snake(type(node).__name__)}"):
-            getattr(self, f"exit_{pascal_to_snake(type(node).__name__)}")(node)
+        if hook := self.get_hook(self._exit_hooks, "exit", type(node)):
+            hook(self, node)
 
     def terminate(self) -> None:
         """Terminate traversal."""
@@ -86,19 +106,20 @@ class Pass(Transform[T]):
     def has_parent_of_node(node: ast.AstNode, parent: ast.AstNode) -> bool:
         """Check if node has parent of type."""
         while node.parent:
-            if node.parent == parent:
+            if node.parent is parent:
                 return True
             node = node.parent
         return False
 
     def recalculate_parents(self, node: ast.AstNode) -> None:
         """Recalculate parents."""
-        if not node:
-            return
-        for i in node.kid:
-            if i:
-                i.parent = node
-                self.recalculate_parents(i)
+        stack = [node] if node else []
+        while stack:
+            cur = stack.pop()
+            for i in cur.kid:
+                if i:
+                    i.parent = cur
+                    stack.append(i)
 
     # Transform Implementations
     # -------------------------
@@ -126,16 +147,36 @@ class Pass(Transform[T]):
             return node
         self.cur_node = node
         self.enter_node(node)
-        if not self.prune_signal:
-            for i in node.kid:
-                if i:
-                    self.traverse(i)
-        else:
-            self.prune_signal = False
-        self.cur_node = node
-        if self.term_signal:
-            return node
-        self.exit_node(node)
+        stack: list[tuple[ast.AstNode, Iterator[ast.AstNode]]] = [
+            (node, iter(() if self.prune_signal else node.kid))
+        ]
+        self.prune_signal = False
+        while stack:
+            cur, kids = stack[-1]
+            for i in kids:
+                if not i:
+                    continue
+                if self.term_signal:
+                    self.cur_node = node
+                    return node
+                self.cur_node = i
+                self.enter_node(i)
+                if not self.prune_signal:
+                    stack.append((i, iter(i.kid)))
+                    break
+                self.prune_signal = False
+                self.cur_node = i
+                if self.term_signal:
+                    self.cur_node = node
+                    return node
+                self.exit_node(i)
+            else:
+                stack.pop()
+                self.cur_node = cur
+                if self.term_signal:
+                    self.cur_node = node
+                    return node
+                self.exit_node(cur)
         return node
 
     def error(self, msg: str, node_override: Optional[ast.AstNode] = None) -> None:
@@ -28,7 +28,7 @@ class AccessCheckPass(Pass):
                 continue
             if not isinstance(expr.name_of, ast.Architype):
                 continue  # Unlikely.
-            if expr.name_of == base_class:
+            if expr.name_of is base_class:
                 return True
             if self.is_class_inherited_from(expr.name_of, base_class):
                 return True
@@ -66,6 +66,15 @@ class AccessCheckPass(Pass):
         """
         # TODO: Enums are not considered at the moment, I'll need to test and add them bellow.
 
+        # Note that currently we can only check for name + symbols, because expressions are not associated with the
+        # typeinfo thus they don't have a symbol. In the future the name nodes will become expression nodes.
+        if not isinstance(sym := node.sym, Symbol):
+            return
+
+        # Public symbols are fine. Checked first since it spares the parent walks below for most names.
+        if sym.access is SymbolAccess.PUBLIC:
+            return
+
         # If the current node is a global variable's name there is no access, it's just the declaration.
         if Pass.find_parent_of_type(node, ast.GlobalVars) is not None:
             return
@@ -82,21 +91,12 @@ class AccessCheckPass(Pass):
         if curr_module is None:
             return
 
-        # Note that currently we can only check for name + symbols, because expressions are not associated with the
-        # typeinfo thus they don't have a symbol. In the future the name nodes will become expression nodes.
-        if not isinstance(node.sym, Symbol):
-            return
-
-        # Public symbols are fine.
-        if node.sym.access == SymbolAccess.PUBLIC:
-            return
-
         # Note that from bellow the access is either private or protected.
-        is_portect = node.sym.access == SymbolAccess.PROTECTED
+        is_portect = sym.access is SymbolAccess.PROTECTED
         access_type = "protected" if is_portect else "private"
 
         # The class we're currently in (None if we're not inside any).
-        sym_owner: ast.AstNode = node.sym.parent_tab.owner
+        sym_owner: ast.AstNode = sym.parent_tab.owner
 
         # If the symbol belongs to a class, we need to check if the access used properly
         # within the class and in it's inherited classes.
@@ -109,7 +109,7 @@ class AccessCheckPass(Pass):
                     node,
                 )
 
-            if curr_class != node.sym.parent_tab.owner:
+            if curr_class is not sym_owner:
                 if not is_portect:  # private member accessed in a different class.
                     return self.report_error(
                         f'Error: Invalid access of {access_type} member "{node.sym_name}".',
@@ -122,7 +122,7 @@ class AccessCheckPass(Pass):
                             node,
                         )
 
-        elif isinstance(sym_owner, ast.Module) and sym_owner != curr_module:
+        elif isinstance(sym_owner, ast.Module) and sym_owner is not curr_module:
             # Accessing a private/public member in a different module.
             return self.report_error(
                 f'Error: Invalid access of {access_type} member "{node.sym_name}".',
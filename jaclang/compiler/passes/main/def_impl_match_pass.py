@@ -97,5 +97,6 @@ class DeclImplMatchPass(Pass):
                     a.name_spec.sym = name_of_links[idx].sym
                 sym.decl.name_of.sym_tab.tab.update(valid_decl.sym_tab.tab)
                 valid_decl.sym_tab.tab = sym.decl.name_of.sym_tab.tab
+                SymbolTable.mark_changed()
         for i in sym_tab.kid:
             self.connect_def_impl(i)
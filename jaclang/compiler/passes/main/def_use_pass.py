@@ -143,6 +143,17 @@ class DefUsePass(Pass):
         right: AtomType,
         is_scope_contained: bool,
         """
+        parent = node.parent
+        if (
+            node.is_attr
+            and not isinstance(node.right, ast.AtomTrailer)
+            and isinstance(parent, ast.AtomTrailer)
+            and parent.is_attr
+            and parent.target is node
+            and not isinstance(parent.right, ast.AtomTrailer)
+        ):
+            # Chain prefix already resolved when the enclosing trailer was entered
+            return
         chain = node.as_attr_list
         node.sym_tab.chain_use_lookup(chain)
 
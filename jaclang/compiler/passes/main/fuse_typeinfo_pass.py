@@ -28,6 +28,7 @@ class FuseTypeInfoPass(Pass):
     """Python and bytecode file self.__debug_printing pass."""
 
     node_type_hash: dict[MypyNodes.Node | VNode, MyType] = {}
+    type_handler_names: dict[type, str] = {}
 
     def __debug_print(self, msg: str) -> None:
         if settings.fuse_type_info_debug:
@@ -36,10 +37,13 @@ class FuseTypeInfoPass(Pass):
     def __call_type_handler(
         self, node: ast.AstSymbolNode, mypy_type: MypyTypes.Type
     ) -> None:
-        mypy_type_name = pascal_to_snake(mypy_type.__class__.__name__)
-        type_handler_name = f"get_type_from_{mypy_type_name}"
-        if hasattr(self, type_handler_name):
-            getattr(self, type_handler_name)(node, mypy_type)
+        mypy_type_cls = type(mypy_type)
+        if (type_handler_name := self.type_handler_names.get(mypy_type_cls)) is None:
+            type_handler_name = self.type_handler_names[mypy_type_cls] = (
+                f"get_type_from_{pascal_to_snake(mypy_type_cls.__name__)}"
+            )
+        if type_handler := getattr(self, type_handler_name, None):
+            type_handler(node, mypy_type)
         else:
             self.__debug_print(
                 f'{node.loc}"MypyTypes::{mypy_type.__class__.__name__}" isn\'t supported yet'
@@ -65,7 +69,7 @@ class FuseTypeInfoPass(Pass):
                 if f:
                     typ_sym_table = f
 
-        if typ_sym_table != self.ir.sym_tab:
+        if typ_sym_table is not self.ir.sym_tab:
             node.name_spec.type_sym_tab = typ_sym_table
 
     def __collect_python_dependencies(self, node: ast.AstNode) -> None:
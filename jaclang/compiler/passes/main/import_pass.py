@@ -131,7 +131,7 @@ class JacImportPass(Pass):
             self.attach_mod_to_node(node, self.import_jac_mod_from_dir(target))
             import_node = node.parent_of_type(ast.Import)
             # And the import is a from import and I am the from module
-            if node == import_node.from_loc:
+            if node is import_node.from_loc:
                 # Import all from items as modules or packages
                 for i in import_node.items.items:
                     if isinstance(i, ast.ModuleItem):
@@ -7,6 +7,7 @@ in each node. Module nodes contain the entire module code.
 import ast as ast3
 import textwrap
 from dataclasses import dataclass
+from itertools import groupby
 from typing import Optional, Sequence, TypeVar
 
 import jaclang.compiler.absyntree as ast
@@ -15,6 +16,10 @@ from jaclang.compiler.passes import Pass
 
 T = TypeVar("T", bound=ast3.AST)
 
+# Expression contexts carry no state, so every Name/Attribute shares these
+_LOAD = ast3.Load()
+_STORE = ast3.Store()
+
 
 class PyastGenPass(Pass):
     """Jac blue transpilation to python pass."""
@@ -42,7 +47,9 @@ class PyastGenPass(Pass):
     def before_pass(self) -> None:
         """Initialize pass."""
         self.debuginfo: dict[str, list[str]] = {"jac_mods": []}
-        self.already_added: list[str] = []
+        self.already_added: set[str] = set()
+        # Location span per jac node, computed once however often it is synced
+        self.sync_spans: dict[ast.AstNode, tuple[int, int, int, int]] = {}
         self.preamble: list[ast3.AST] = [
             self.sync(
                 ast3.ImportFrom(
@@ -89,7 +96,7 @@ class PyastGenPass(Pass):
                 jac_node=self.ir,
             )
         )
-        self.already_added.append(self.needs_jac_import.__name__)
+        self.already_added.add(self.needs_jac_import.__name__)
 
     def needs_typing(self) -> None:
         """Check if enum is needed."""
@@ -108,7 +115,7 @@ class PyastGenPass(Pass):
                 jac_node=self.ir,
             )
         )
-        self.already_added.append(self.needs_typing.__name__)
+        self.already_added.add(self.needs_typing.__name__)
 
     def needs_abc(self) -> None:
         """Check if enum is needed."""
@@ -127,7 +134,7 @@ class PyastGenPass(Pass):
                 jac_node=self.ir,
             )
         )
-        self.already_added.append(self.needs_abc.__name__)
+        self.already_added.add(self.needs_abc.__name__)
 
     def needs_enum(self) -> None:
         """Check if enum is needed."""
@@ -146,7 +153,7 @@ class PyastGenPass(Pass):
                 jac_node=self.ir,
             )
         )
-        self.already_added.append(self.needs_enum.__name__)
+        self.already_added.add(self.needs_enum.__name__)
 
     def needs_jac_feature(self) -> None:
         """Check if enum is needed."""
@@ -176,7 +183,7 @@ class PyastGenPass(Pass):
                 jac_node=self.ir,
             )
         )
-        self.already_added.append(self.needs_jac_feature.__name__)
+        self.already_added.add(self.needs_jac_feature.__name__)
 
     def needs_dataclass(self) -> None:
         """Check if enum is needed."""
@@ -196,7 +203,7 @@ class PyastGenPass(Pass):
                 jac_node=self.ir,
             )
         )
-        self.already_added.append(self.needs_dataclass.__name__)
+        self.already_added.add(self.needs_dataclass.__name__)
 
     def needs_dataclass_field(self) -> None:
         """Check if enum is needed."""
@@ -214,16 +221,16 @@ class PyastGenPass(Pass):
                 jac_node=self.ir,
             )
         )
-        self.already_added.append(self.needs_dataclass_field.__name__)
+        self.already_added.add(self.needs_dataclass_field.__name__)
 
     def flatten(self, body: list[T | list[T] | None]) -> list[T]:
         """Flatten ast list."""
-        new_body = []
+        new_body: list[T] = []
         for i in body:
             if isinstance(i, list):
-                new_body += i
+                new_body.extend(i)
             elif i is not None:
-                new_body.append(i) if i else None
+                new_body.append(i)
         return new_body
 
     def sync(
@@ -232,22 +239,20 @@ class PyastGenPass(Pass):
         """Sync ast locations."""
         if not jac_node:
             jac_node = self.cur_node
+        span = self.sync_spans.get(jac_node)
+        if span is None:
+            loc = jac_node.loc
+            first_line, col_start = loc.first_line, loc.col_start
+            last_line, col_end = loc.last_line, loc.col_end
+            span = self.sync_spans[jac_node] = (
+                first_line,
+                col_start,
+                last_line if last_line and last_line > first_line else first_line,
+                col_end if col_end and col_end > col_start else col_start,
+            )
         for i in ast3.walk(py_node) if deep else [py_node]:
-            if isinstance(i, ast3.AST):
-                i.lineno = jac_node.loc.first_line
-                i.col_offset = jac_node.loc.col_start
-                i.end_lineno = (
-                    jac_node.loc.last_line
-                    if jac_node.loc.last_line
-                    and (jac_node.loc.last_line > jac_node.loc.first_line)
-                    else jac_node.loc.first_line
-                )
-                i.end_col_offset = (
-                    jac_node.loc.col_end
-                    if jac_node.loc.col_end
-                    and (jac_node.loc.col_end > jac_node.loc.col_start)
-                    else jac_node.loc.col_start
-                )
+            if isinstance(i, ast3.AST) and not isinstance(i, ast3.expr_context):
+                i.lineno, i.col_offset, i.end_lineno, i.end_col_offset = span
                 i.jac_link: list[ast3.AST] = [jac_node]  # type: ignore
         return py_node
 
@@ -277,24 +282,14 @@ class PyastGenPass(Pass):
         doc: Optional[ast.String] = None,
     ) -> list[ast3.AST]:
         """Unwind codeblock."""
-        valid_stmts = (
-            [i for i in node.items if not isinstance(i, ast.Semi)] if node else []
-        )
-        ret: list[ast3.AST] = (
-            [self.sync(ast3.Pass(), node)]
-            if isinstance(node, ast.SubNodeList) and not valid_stmts
-            else (
-                self.flatten(
-                    [
-                        x.gen.py_ast
-                        for x in valid_stmts
-                        if not isinstance(x, ast.AstImplOnlyNode)
-                    ]
-                )
-                if node and isinstance(node.gen.py_ast, list)
-                else []
-            )
-        )
+        ret: list[ast3.AST] = []
+        if node:
+            stmts = [i for i in node.items if not isinstance(i, ast.Semi)]
+            if not stmts:
+                ret.append(self.sync(ast3.Pass(), node))
+            for x in stmts:
+                if not isinstance(x, ast.AstImplOnlyNode):
+                    ret.extend(x.gen.py_ast)
         if doc:
             ret = [self.sync(ast3.Expr(value=doc.gen.py_ast[0]), jac_node=doc), *ret]
         return ret
@@ -310,16 +305,11 @@ class PyastGenPass(Pass):
     ) -> ast3.AST:
         """Convert list to attribute."""
         attr_node: ast3.Name | ast3.Attribute = self.sync(
-            ast3.Name(id=attribute_list[0], ctx=ast3.Load()), sync_node_list[0]
+            ast3.Name(id=attribute_list[0], ctx=_LOAD), sync_node_list[0]
         )
-        for i in range(len(attribute_list)):
-            if i == 0:
-                continue
+        for attr, sync_node in zip(attribute_list[1:], sync_node_list[1:]):
             attr_node = self.sync(
-                ast3.Attribute(
-                    value=attr_node, attr=attribute_list[i], ctx=ast3.Load()
-                ),
-                sync_node_list[i],
+                ast3.Attribute(value=attr_node, attr=attr, ctx=_LOAD), sync_node
             )
         return attr_node
 
@@ -335,7 +325,10 @@ class PyastGenPass(Pass):
 
         items: Sequence[T],
         """
-        node.gen.py_ast = self.flatten([i.gen.py_ast for i in node.items])
+        py_ast: list[ast3.AST] = []
+        for i in node.items:
+            py_ast.extend(i.gen.py_ast)
+        node.gen.py_ast = py_ast
 
     def exit_module(self, node: ast.Module) -> None:
         """Sub objects.
@@ -362,16 +355,10 @@ class PyastGenPass(Pass):
             if node.doc
             else [*self.preamble, *[x.gen.py_ast for x in pre_body]]
         )
-        new_body = []
-        for i in body:
-            if isinstance(i, list):
-                new_body += i
-            else:
-                new_body.append(i) if i else None
         node.gen.py_ast = [
             self.sync(
                 ast3.Module(
-                    body=new_body,
+                    body=self.flatten(body),
                     type_ignores=[],
                 )
             )
@@ -425,10 +412,10 @@ class PyastGenPass(Pass):
                     self.sync(
                         ast3.Attribute(
                             value=self.sync(
-                                ast3.Name(id=Con.JAC_FEATURE.value, ctx=ast3.Load())
+                                ast3.Name(id=Con.JAC_FEATURE.value, ctx=_LOAD)
                             ),
                             attr="create_test",
-                            ctx=ast3.Load(),
+                            ctx=_LOAD,
                         )
                     )
                 ],
@@ -444,10 +431,10 @@ class PyastGenPass(Pass):
                         func=self.sync(
                             ast3.Attribute(
                                 value=self.sync(
-                                    ast3.Name(id=Con.JAC_FEATURE.value, ctx=ast3.Load())
+                                    ast3.Name(id=Con.JAC_FEATURE.value, ctx=_LOAD)
                                 ),
                                 attr="impl_patch_filename",
-                                ctx=ast3.Load(),
+                                ctx=_LOAD,
                             )
                         ),
                         args=[],
@@ -480,9 +467,7 @@ class PyastGenPass(Pass):
                     ast3.If(
                         test=self.sync(
                             ast3.Compare(
-                                left=self.sync(
-                                    ast3.Name(id="__name__", ctx=ast3.Load())
-                                ),
+                                left=self.sync(ast3.Name(id="__name__", ctx=_LOAD)),
                                 ops=[self.sync(ast3.Eq())],
                                 comparators=[
                                     self.sync(
@@ -580,7 +565,7 @@ class PyastGenPass(Pass):
                                                 self.sync(
                                                     ast3.Name(
                                                         id=path_named_value,
-                                                        ctx=ast3.Store(),
+                                                        ctx=_STORE,
                                                     )
                                                 )
                                             ]
@@ -594,13 +579,13 @@ class PyastGenPass(Pass):
                                                             if v.value
                                                             else k.value
                                                         ),
-                                                        ctx=ast3.Store(),
+                                                        ctx=_STORE,
                                                     )
                                                 )
                                                 for k, v in zip(item_keys, item_values)
                                             ]
                                         ),
-                                        ctx=ast3.Store(),
+                                        ctx=_STORE,
                                     )
                                 )
                             ]
@@ -608,7 +593,7 @@ class PyastGenPass(Pass):
                         value=self.sync(
                             ast3.Call(
                                 func=self.sync(
-                                    ast3.Name(id="__jac_import__", ctx=ast3.Load())
+                                    ast3.Name(id="__jac_import__", ctx=_LOAD)
                                 ),
                                 args=[],
                                 keywords=[
@@ -626,7 +611,7 @@ class PyastGenPass(Pass):
                                             value=self.sync(
                                                 ast3.Name(
                                                     id="__file__",
-                                                    ctx=ast3.Load(),
+                                                    ctx=_LOAD,
                                                 )
                                             ),
                                         )
@@ -679,7 +664,7 @@ class PyastGenPass(Pass):
             runtime_nodes.append(
                 self.sync(
                     ast3.For(
-                        target=self.sync(ast3.Name(id="i", ctx=ast3.Store())),
+                        target=self.sync(ast3.Name(id="i", ctx=_STORE)),
                         iter=self.sync(
                             ast3.IfExp(
                                 test=self.sync(
@@ -692,11 +677,11 @@ class PyastGenPass(Pass):
                                                     value=self.sync(
                                                         ast3.Name(
                                                             id=path_named_value,
-                                                            ctx=ast3.Load(),
+                                                            ctx=_LOAD,
                                                         )
                                                     ),
                                                     attr="__dict__",
-                                                    ctx=ast3.Load(),
+                                                    ctx=_LOAD,
                                                 )
                                             )
                                         ],
@@ -705,23 +690,19 @@ class PyastGenPass(Pass):
                                 body=self.sync(
                                     ast3.Attribute(
                                         value=self.sync(
-                                            ast3.Name(
-                                                id=path_named_value, ctx=ast3.Load()
-                                            )
+                                            ast3.Name(id=path_named_value, ctx=_LOAD)
                                         ),
                                         attr="__all__",
-                                        ctx=ast3.Load(),
+                                        ctx=_LOAD,
                                     )
                                 ),
                                 orelse=self.sync(
                                     ast3.Attribute(
                                         value=self.sync(
-                                            ast3.Name(
-                                                id=path_named_value, ctx=ast3.Load()
-                                            )
+                                            ast3.Name(id=path_named_value, ctx=_LOAD)
                                         ),
                                         attr="__dict__",
-                                        ctx=ast3.Load(),
+                                        ctx=_LOAD,
                                     )
                                 ),
                             )
@@ -739,11 +720,11 @@ class PyastGenPass(Pass):
                                                             value=self.sync(
                                                                 ast3.Name(
                                                                     id="i",
-                                                                    ctx=ast3.Load(),
+                                                                    ctx=_LOAD,
                                                                 )
                                                             ),
                                                             attr="startswith",
-                                                            ctx=ast3.Load(),
+                                                            ctx=_LOAD,
                                                         )
                                                     ),
                                                     args=[
@@ -764,7 +745,7 @@ class PyastGenPass(Pass):
                                                         func=self.sync(
                                                             ast3.Name(
                                                                 id="exec",
-                                                                ctx=ast3.Load(),
+                                                                ctx=_LOAD,
                                                             )
                                                         ),
                                                         args=[
@@ -776,7 +757,7 @@ class PyastGenPass(Pass):
                                                                                 value=self.sync(
                                                                                     ast3.Name(
                                                                                         id="i",
-                                                                                        ctx=ast3.Load(),
+                                                                                        ctx=_LOAD,
                                                                                     )
                                                                                 ),
                                                                                 conversion=-1,
@@ -792,7 +773,7 @@ class PyastGenPass(Pass):
                                                                                 value=self.sync(
                                                                                     ast3.Name(
                                                                                         id="i",
-                                                                                        ctx=ast3.Load(),
+                                                                                        ctx=_LOAD,
                                                                                     )
                                                                                 ),
                                                                                 conversion=-1,
@@ -857,9 +838,9 @@ class PyastGenPass(Pass):
                 ast3.If(
                     test=self.sync(
                         ast3.Attribute(
-                            value=self.sync(ast3.Name(id="_jac_typ", ctx=ast3.Load())),
+                            value=self.sync(ast3.Name(id="_jac_typ", ctx=_LOAD)),
                             attr="TYPE_CHECKING",
-                            ctx=ast3.Load(),
+                            ctx=_LOAD,
                         )
                     ),
                     body=typecheck_nodes,
@@ -945,10 +926,10 @@ class PyastGenPass(Pass):
                         func=self.sync(
                             ast3.Attribute(
                                 value=self.sync(
-                                    ast3.Name(id=Con.JAC_FEATURE.value, ctx=ast3.Load())
+                                    ast3.Name(id=Con.JAC_FEATURE.value, ctx=_LOAD)
                                 ),
                                 attr=f"make_{node.arch_type.value}",
-                                ctx=ast3.Load(),
+                                ctx=_LOAD,
                             )
                         ),
                         args=[],
@@ -957,7 +938,7 @@ class PyastGenPass(Pass):
                                 ast3.keyword(
                                     arg="on_entry",
                                     value=self.sync(
-                                        ast3.List(elts=ds_on_entry, ctx=ast3.Load())
+                                        ast3.List(elts=ds_on_entry, ctx=_LOAD)
                                     ),
                                 )
                             ),
@@ -965,7 +946,7 @@ class PyastGenPass(Pass):
                                 ast3.keyword(
                                     arg="on_exit",
                                     value=self.sync(
-                                        ast3.List(elts=ds_on_exit, ctx=ast3.Load())
+                                        ast3.List(elts=ds_on_exit, ctx=_LOAD)
                                     ),
                                 )
                             ),
@@ -976,9 +957,7 @@ class PyastGenPass(Pass):
             decorators.append(
                 self.sync(
                     ast3.Call(
-                        func=self.sync(
-                            ast3.Name(id="__jac_dataclass__", ctx=ast3.Load())
-                        ),
+                        func=self.sync(ast3.Name(id="__jac_dataclass__", ctx=_LOAD)),
                         args=[],
                         keywords=[
                             self.sync(
@@ -998,11 +977,9 @@ class PyastGenPass(Pass):
             base_classes.append(
                 self.sync(
                     ast3.Attribute(
-                        value=self.sync(
-                            ast3.Name(id=Con.JAC_FEATURE.value, ctx=ast3.Load())
-                        ),
+                        value=self.sync(ast3.Name(id=Con.JAC_FEATURE.value, ctx=_LOAD)),
                         attr=node.arch_type.value.capitalize(),
-                        ctx=ast3.Load(),
+                        ctx=_LOAD,
                     )
                 )
             )
@@ -1011,9 +988,9 @@ class PyastGenPass(Pass):
             base_classes.append(
                 self.sync(
                     ast3.Attribute(
-                        value=self.sync(ast3.Name(id="_jac_abc", ctx=ast3.Load())),
+                        value=self.sync(ast3.Name(id="_jac_abc", ctx=_LOAD)),
                         attr="ABC",
-                        ctx=ast3.Load(),
+                        ctx=_LOAD,
                     )
                 )
             )
@@ -1049,10 +1026,10 @@ class PyastGenPass(Pass):
                         func=self.sync(
                             ast3.Attribute(
                                 value=self.sync(
-                                    ast3.Name(id=Con.JAC_FEATURE.value, ctx=ast3.Load())
+                                    ast3.Name(id=Con.JAC_FEATURE.value, ctx=_LOAD)
                                 ),
                                 attr="DSFunc",
-                                ctx=ast3.Load(),
+                                ctx=_LOAD,
                             )
                         ),
                         args=[
@@ -1117,9 +1094,7 @@ class PyastGenPass(Pass):
         )
         base_classes = node.base_classes.gen.py_ast if node.base_classes else []
         if isinstance(base_classes, list):
-            base_classes.append(
-                self.sync(ast3.Name(id="__jac_Enum__", ctx=ast3.Load()))
-            )
+            base_classes.append(self.sync(ast3.Name(id="__jac_Enum__", ctx=_LOAD)))
         else:
             raise self.ice()
         node.gen.py_ast = [
@@ -1222,10 +1197,10 @@ class PyastGenPass(Pass):
                         func=self.sync(
                             ast3.Attribute(
                                 value=self.sync(
-                                    ast3.Name(id=Con.JAC_FEATURE.value, ctx=ast3.Load())
+                                    ast3.Name(id=Con.JAC_FEATURE.value, ctx=_LOAD)
                                 ),
                                 attr="impl_patch_filename",
-                                ctx=ast3.Load(),
+                                ctx=_LOAD,
                             )
                         ),
                         args=[],
@@ -1247,9 +1222,9 @@ class PyastGenPass(Pass):
             decorator_list.append(
                 self.sync(
                     ast3.Attribute(
-                        value=self.sync(ast3.Name(id="_jac_abc", ctx=ast3.Load())),
+                        value=self.sync(ast3.Name(id="_jac_abc", ctx=_LOAD)),
                         attr="abstractmethod",
-                        ctx=ast3.Load(),
+                        ctx=_LOAD,
                     )
                 )
             )
@@ -1258,16 +1233,14 @@ class PyastGenPass(Pass):
             decorator_list.append(
                 self.sync(
                     ast3.Attribute(
-                        value=self.sync(ast3.Name(id="_jac_typ", ctx=ast3.Load())),
+                        value=self.sync(ast3.Name(id="_jac_typ", ctx=_LOAD)),
                         attr="override",
-                        ctx=ast3.Load(),
+                        ctx=_LOAD,
                     )
                 )
             )
         if node.is_static:
-            decorator_list.insert(
-                0, self.sync(ast3.Name(id="staticmethod", ctx=ast3.Load()))
-            )
+            decorator_list.insert(0, self.sync(ast3.Name(id="staticmethod", ctx=_LOAD)))
         if not body and not isinstance(node.body, ast.FuncCall):
             self.error("Ability has no body. Perhaps an impl must be imported.", node)
             body = [self.sync(ast3.Pass(), node)]
@@ -1392,10 +1365,10 @@ class PyastGenPass(Pass):
                     self.sync(
                         ast3.Attribute(
                             value=self.sync(
-                                ast3.Name(id=Con.JAC_FEATURE.value, ctx=ast3.Load())
+                                ast3.Name(id=Con.JAC_FEATURE.value, ctx=_LOAD)
                             ),
                             attr="RootType",
-                            ctx=ast3.Load(),
+                            ctx=_LOAD,
                         )
                     )
                 ]
@@ -1404,9 +1377,9 @@ class PyastGenPass(Pass):
                 node.gen.py_ast = [
                     self.sync(
                         ast3.Attribute(
-                            value=self.sync(ast3.Name(id="_jac_typ", ctx=ast3.Load())),
+                            value=self.sync(ast3.Name(id="_jac_typ", ctx=_LOAD)),
                             attr=node.arch_name.sym_name,
-                            ctx=ast3.Load(),
+                            ctx=_LOAD,
                         )
                     )
                 ]
@@ -1418,25 +1391,23 @@ class PyastGenPass(Pass):
 
         archs: Sequence[ArchRef],
         """
-
-        def make_attr_chain(arch: list[ast.ArchRef]) -> list[ast3.AST]:
-            """Make attr chain."""
-            if len(arch) == 0:
-                return []
-            if len(arch) == 1 and isinstance(arch[0].gen.py_ast, ast3.AST):
-                return arch[0].gen.py_ast
-            cur = arch[-1]
-            attr = self.sync(
-                ast3.Attribute(
-                    value=make_attr_chain(arch[:-1]),
-                    attr=cur.arch_name.sym_name,
-                    ctx=ast3.Load(),
-                ),
-                jac_node=cur,
+        attr_chain: list[ast3.AST] = []
+        for arch in node.archs:
+            attr_chain = (
+                [
+                    self.sync(
+                        ast3.Attribute(
+                            value=attr_chain[0],
+                            attr=arch.arch_name.sym_name,
+                            ctx=_LOAD,
+                        ),
+                        jac_node=arch,
+                    )
+                ]
+                if attr_chain
+                else arch.gen.py_ast
             )
-            return [attr]
-
-        node.gen.py_ast = make_attr_chain(node.archs)
+        node.gen.py_ast = attr_chain
 
     def exit_param_var(self, node: ast.ParamVar) -> None:
         """Sub objects.
@@ -1510,13 +1481,13 @@ class PyastGenPass(Pass):
                 ast3.Subscript(
                     value=self.sync(
                         ast3.Attribute(
-                            value=self.sync(ast3.Name(id="_jac_typ", ctx=ast3.Load())),
+                            value=self.sync(ast3.Name(id="_jac_typ", ctx=_LOAD)),
                             attr="ClassVar",
-                            ctx=ast3.Load(),
+                            ctx=_LOAD,
                         )
                     ),
                     slice=annotation,
-                    ctx=ast3.Load(),
+                    ctx=_LOAD,
                 )
             )
         (
@@ -1538,11 +1509,11 @@ class PyastGenPass(Pass):
                                             value=self.sync(
                                                 ast3.Name(
                                                     id=Con.JAC_FEATURE.value,
-                                                    ctx=ast3.Load(),
+                                                    ctx=_LOAD,
                                                 )
                                             ),
                                             attr="has_instance_default",
-                                            ctx=ast3.Load(),
+                                            ctx=_LOAD,
                                         )
                                     ),
                                     args=[],
@@ -1579,7 +1550,7 @@ class PyastGenPass(Pass):
                                         func=self.sync(
                                             ast3.Name(
                                                 id="__jac_field__",
-                                                ctx=ast3.Load(),
+                                                ctx=_LOAD,
                                             )
                                         ),
                                         args=[],
@@ -1993,9 +1964,9 @@ class PyastGenPass(Pass):
         # assert_func_expr = "_jac_check.assertXXX"
         assert_func_expr: ast3.Attribute = self.sync(
             ast3.Attribute(
-                value=self.sync(ast3.Name(id="_jac_check", ctx=ast3.Load())),
+                value=self.sync(ast3.Name(id="_jac_check", ctx=_LOAD)),
                 attr=assert_func_name,
-                ctx=ast3.Load(),
+                ctx=_LOAD,
             )
         )
 
@@ -2051,11 +2022,11 @@ class PyastGenPass(Pass):
                                         value=self.sync(
                                             ast3.Name(
                                                 id=Con.JAC_FEATURE.value,
-                                                ctx=ast3.Load(),
+                                                ctx=_LOAD,
                                             )
                                         ),
                                         attr="report",
-                                        ctx=ast3.Load(),
+                                        ctx=_LOAD,
                                     )
                                 ),
                                 args=node.expr.gen.py_ast,
@@ -2100,9 +2071,9 @@ class PyastGenPass(Pass):
         target: ExprType,
         """
         loc = self.sync(
-            ast3.Name(id="self", ctx=ast3.Load())
+            ast3.Name(id="self", ctx=_LOAD)
             if node.from_walker
-            else ast3.Name(id=Con.HERE.value, ctx=ast3.Load())
+            else ast3.Name(id=Con.HERE.value, ctx=_LOAD)
         )
         node.gen.py_ast = [
             self.sync(
@@ -2112,12 +2083,10 @@ class PyastGenPass(Pass):
                             func=self.sync(
                                 ast3.Attribute(
                                     value=self.sync(
-                                        ast3.Name(
-                                            id=Con.JAC_FEATURE.value, ctx=ast3.Load()
-                                        )
+                                        ast3.Name(id=Con.JAC_FEATURE.value, ctx=_LOAD)
                                     ),
                                     attr="ignore",
-                                    ctx=ast3.Load(),
+                                    ctx=_LOAD,
                                 )
                             ),
                             args=[loc, node.target.gen.py_ast[0]],
@@ -2136,9 +2105,9 @@ class PyastGenPass(Pass):
         else_body: Optional[ElseStmt],
         """
         loc = self.sync(
-            ast3.Name(id="self", ctx=ast3.Load())
+            ast3.Name(id="self", ctx=_LOAD)
             if node.from_walker
-            else ast3.Name(id=Con.HERE.value, ctx=ast3.Load())
+            else ast3.Name(id=Con.HERE.value, ctx=_LOAD)
         )
         node.gen.py_ast = [
             self.sync(
@@ -2148,12 +2117,10 @@ class PyastGenPass(Pass):
                             func=self.sync(
                                 ast3.Attribute(
                                     value=self.sync(
-                                        ast3.Name(
-                                            id=Con.JAC_FEATURE.value, ctx=ast3.Load()
-                                        )
+                                        ast3.Name(id=Con.JAC_FEATURE.value, ctx=_LOAD)
                                     ),
                                     attr="visit_node",
-                                    ctx=ast3.Load(),
+                                    ctx=_LOAD,
                                 )
                             ),
                             args=[loc, node.target.gen.py_ast[0]],
@@ -2180,9 +2147,9 @@ class PyastGenPass(Pass):
     def exit_disengage_stmt(self, node: ast.DisengageStmt) -> None:
         """Sub objects."""
         loc = self.sync(
-            ast3.Name(id="self", ctx=ast3.Load())
+            ast3.Name(id="self", ctx=_LOAD)
             if node.from_walker
-            else ast3.Name(id=Con.HERE.value, ctx=ast3.Load())
+            else ast3.Name(id=Con.HERE.value, ctx=_LOAD)
         )
         node.gen.py_ast = [
             self.sync(
@@ -2195,11 +2162,11 @@ class PyastGenPass(Pass):
                                         value=self.sync(
                                             ast3.Name(
                                                 id=Con.JAC_FEATURE.value,
-                                                ctx=ast3.Load(),
+                                                ctx=_LOAD,
                                             )
                                         ),
                                         attr="disengage",
-                                        ctx=ast3.Load(),
+                                        ctx=_LOAD,
                                     )
                                 ),
                                 args=[loc],
@@ -2263,7 +2230,7 @@ class PyastGenPass(Pass):
             else (
                 self.sync(
                     ast3.Call(
-                        func=self.sync(ast3.Name(id="__jac_auto__", ctx=ast3.Load())),
+                        func=self.sync(ast3.Name(id="__jac_auto__", ctx=_LOAD)),
                         args=[],
                         keywords=[],
                     )
@@ -2312,10 +2279,10 @@ class PyastGenPass(Pass):
                         func=self.sync(
                             ast3.Attribute(
                                 value=self.sync(
-                                    ast3.Name(id=Con.JAC_FEATURE.value, ctx=ast3.Load())
+                                    ast3.Name(id=Con.JAC_FEATURE.value, ctx=_LOAD)
                                 ),
                                 attr="connect",
-                                ctx=ast3.Load(),
+                                ctx=_LOAD,
                             )
                         ),
                         args=[],
@@ -2357,10 +2324,10 @@ class PyastGenPass(Pass):
                         func=self.sync(
                             ast3.Attribute(
                                 value=self.sync(
-                                    ast3.Name(id=Con.JAC_FEATURE.value, ctx=ast3.Load())
+                                    ast3.Name(id=Con.JAC_FEATURE.value, ctx=_LOAD)
                                 ),
                                 attr="disconnect",
-                                ctx=ast3.Load(),
+                                ctx=_LOAD,
                             )
                         ),
                         args=[
@@ -2373,15 +2340,15 @@ class PyastGenPass(Pass):
                                             value=self.sync(
                                                 ast3.Name(
                                                     id=Con.JAC_FEATURE.value,
-                                                    ctx=ast3.Load(),
+                                                    ctx=_LOAD,
                                                 )
                                             ),
                                             attr="EdgeDir",
-                                            ctx=ast3.Load(),
+                                            ctx=_LOAD,
                                         )
                                     ),
                                     attr=node.op.edge_spec.edge_dir.name,
-                                    ctx=ast3.Load(),
+                                    ctx=_LOAD,
                                 )
                             ),
                             (
@@ -2406,7 +2373,7 @@ class PyastGenPass(Pass):
         elif node.op.name in [Tok.WALRUS_EQ] and isinstance(
             node.left.gen.py_ast[0], ast3.Name
         ):
-            node.left.gen.py_ast[0].ctx = ast3.Store()  # TODO: Short term fix
+            node.left.gen.py_ast[0].ctx = _STORE  # TODO: Short term fix
             node.gen.py_ast = [
                 self.sync(
                     ast3.NamedExpr(
@@ -2458,10 +2425,10 @@ class PyastGenPass(Pass):
                         func=self.sync(
                             ast3.Attribute(
                                 value=self.sync(
-                                    ast3.Name(id=Con.JAC_FEATURE.value, ctx=ast3.Load())
+                                    ast3.Name(id=Con.JAC_FEATURE.value, ctx=_LOAD)
                                 ),
                                 attr="spawn_call",
-                                ctx=ast3.Load(),
+                                ctx=_LOAD,
                             )
                         ),
                         args=[node.left.gen.py_ast[0], node.right.gen.py_ast[0]],
@@ -2497,10 +2464,10 @@ class PyastGenPass(Pass):
                         func=self.sync(
                             ast3.Attribute(
                                 value=self.sync(
-                                    ast3.Name(id=Con.JAC_FEATURE.value, ctx=ast3.Load())
+                                    ast3.Name(id=Con.JAC_FEATURE.value, ctx=_LOAD)
                                 ),
                                 attr="elvis",
-                                ctx=ast3.Load(),
+                                ctx=_LOAD,
                             )
                         ),
                         args=[node.left.gen.py_ast[0], node.right.gen.py_ast[0]],
@@ -2629,7 +2596,7 @@ class PyastGenPass(Pass):
             ctx_val = (
                 node.operand.py_ctx_func()
                 if isinstance(node.operand, ast.AstSymbolNode)
-                else ast3.Load()
+                else _LOAD
             )
             node.gen.py_ast = [
                 self.sync(
@@ -2648,10 +2615,10 @@ class PyastGenPass(Pass):
                         func=self.sync(
                             ast3.Attribute(
                                 value=self.sync(
-                                    ast3.Name(id=Con.JAC_FEATURE.value, ctx=ast3.Load())
+                                    ast3.Name(id=Con.JAC_FEATURE.value, ctx=_LOAD)
                                 ),
                                 attr="get_object",
-                                ctx=ast3.Load(),
+                                ctx=_LOAD,
                             )
                         ),
                         args=[],
@@ -2707,22 +2674,13 @@ class PyastGenPass(Pass):
             return pieces
 
         combined_multi: list[str | bytes | ast3.AST] = []
-        for item in get_pieces(node.strings):
-            if (
-                combined_multi
-                and isinstance(item, str)
-                and isinstance(combined_multi[-1], str)
-            ):
-                if isinstance(combined_multi[-1], str):
-                    combined_multi[-1] += item
-            elif (
-                combined_multi
-                and isinstance(item, bytes)
-                and isinstance(combined_multi[-1], bytes)
-            ):
-                combined_multi[-1] += item
+        for kind, run in groupby(get_pieces(node.strings), key=type):
+            if kind is str:
+                combined_multi.append("".join(run))  # type: ignore[arg-type]
+            elif kind is bytes:
+                combined_multi.append(b"".join(run))  # type: ignore[arg-type]
             else:
-                combined_multi.append(item)
+                combined_multi.extend(run)
         for i in range(len(combined_multi)):
             if isinstance(combined_multi[i], (str, bytes)):
                 combined_multi[i] = self.sync(ast3.Constant(value=combined_multi[i]))
@@ -2956,10 +2914,10 @@ class PyastGenPass(Pass):
                         func=self.sync(
                             ast3.Attribute(
                                 value=self.sync(
-                                    ast3.Name(id=Con.JAC_FEATURE.value, ctx=ast3.Load())
+                                    ast3.Name(id=Con.JAC_FEATURE.value, ctx=_LOAD)
                                 ),
                                 attr="assign_compr",
-                                ctx=ast3.Load(),
+                                ctx=_LOAD,
                             )
                         ),
                         args=[node.target.gen.py_ast[0], node.right.gen.py_ast[0]],
@@ -2976,25 +2934,23 @@ class PyastGenPass(Pass):
                         ctx=(
                             node.right.py_ctx_func()
                             if isinstance(node.right, ast.AstSymbolNode)
-                            else ast3.Load()
+                            else _LOAD
                         ),
                     )
                 )
             ]
-            node.right.gen.py_ast[0].ctx = ast3.Load()  # type: ignore
+            node.right.gen.py_ast[0].ctx = _LOAD  # type: ignore
         if node.is_null_ok:
             if isinstance(node.gen.py_ast[0], ast3.Attribute):
                 node.gen.py_ast[0].value = self.sync(
-                    ast3.Name(id="__jac_tmp", ctx=ast3.Load())
+                    ast3.Name(id="__jac_tmp", ctx=_LOAD)
                 )
             node.gen.py_ast = [
                 self.sync(
                     ast3.IfExp(
                         test=self.sync(
                             ast3.NamedExpr(
-                                target=self.sync(
-                                    ast3.Name(id="__jac_tmp", ctx=ast3.Store())
-                                ),
+                                target=self.sync(ast3.Name(id="__jac_tmp", ctx=_STORE)),
                                 value=node.target.gen.py_ast[0],
                             )
                         ),
@@ -3123,11 +3079,11 @@ class PyastGenPass(Pass):
                                 value=self.sync(
                                     ast3.Name(
                                         id=Con.JAC_FEATURE.value,
-                                        ctx=ast3.Load(),
+                                        ctx=_LOAD,
                                     )
                                 ),
                                 attr="get_root",
-                                ctx=ast3.Load(),
+                                ctx=_LOAD,
                             )
                         ),
                         args=[],
@@ -3171,7 +3127,7 @@ class PyastGenPass(Pass):
                         if next_i and not isinstance(next_i, ast.FilterCompr)
                         else None
                     ),
-                    edges_only=node.edges_only and cur == last_edge,
+                    edges_only=node.edges_only and cur is last_edge,
                 )
                 if next_i and isinstance(next_i, ast.FilterCompr):
                     pynode = self.sync(
@@ -3187,7 +3143,7 @@ class PyastGenPass(Pass):
                     pynode,
                     cur,
                     targ=None,
-                    edges_only=node.edges_only and cur == last_edge,
+                    edges_only=node.edges_only and cur is last_edge,
                 )
             else:
                 raise self.ice("Invalid edge ref trailer")
@@ -3202,9 +3158,9 @@ class PyastGenPass(Pass):
         edge_dir: EdgeDir,
         """
         loc = self.sync(
-            ast3.Name(id=Con.HERE.value, ctx=ast3.Load())
+            ast3.Name(id=Con.HERE.value, ctx=_LOAD)
             if node.from_walker
-            else ast3.Name(id="self", ctx=ast3.Load())
+            else ast3.Name(id="self", ctx=_LOAD)
         )
         node.gen.py_ast = [loc]
 
@@ -3220,11 +3176,9 @@ class PyastGenPass(Pass):
             ast3.Call(
                 func=self.sync(
                     ast3.Attribute(
-                        value=self.sync(
-                            ast3.Name(id=Con.JAC_FEATURE.value, ctx=ast3.Load())
-                        ),
+                        value=self.sync(ast3.Name(id=Con.JAC_FEATURE.value, ctx=_LOAD)),
                         attr="edge_ref",
-                        ctx=ast3.Load(),
+                        ctx=_LOAD,
                     )
                 ),
                 args=[loc],
@@ -3247,15 +3201,15 @@ class PyastGenPass(Pass):
                                             value=self.sync(
                                                 ast3.Name(
                                                     id=Con.JAC_FEATURE.value,
-                                                    ctx=ast3.Load(),
+                                                    ctx=_LOAD,
                                                 )
                                             ),
                                             attr="EdgeDir",
-                                            ctx=ast3.Load(),
+                                            ctx=_LOAD,
                                         )
                                     ),
                                     attr=node.edge_dir.name,
-                                    ctx=ast3.Load(),
+                                    ctx=_LOAD,
                                 )
                             ),
                         )
@@ -3300,10 +3254,10 @@ class PyastGenPass(Pass):
                     func=self.sync(
                         ast3.Attribute(
                             value=self.sync(
-                                ast3.Name(id=Con.JAC_FEATURE.value, ctx=ast3.Load())
+                                ast3.Name(id=Con.JAC_FEATURE.value, ctx=_LOAD)
                             ),
                             attr="build_edge",
-                            ctx=ast3.Load(),
+                            ctx=_LOAD,
                         )
                     ),
                     args=[],
@@ -3360,16 +3314,12 @@ class PyastGenPass(Pass):
                     ),
                     body=self.sync(
                         ast3.ListComp(
-                            elt=self.sync(ast3.Name(id="i", ctx=ast3.Load())),
+                            elt=self.sync(ast3.Name(id="i", ctx=_LOAD)),
                             generators=[
                                 self.sync(
                                     ast3.comprehension(
-                                        target=self.sync(
-                                            ast3.Name(id="i", ctx=ast3.Store())
-                                        ),
-                                        iter=self.sync(
-                                            ast3.Name(id="x", ctx=ast3.Load())
-                                        ),
+                                        target=self.sync(ast3.Name(id="i", ctx=_STORE)),
+                                        iter=self.sync(ast3.Name(id="x", ctx=_LOAD)),
                                         ifs=(
                                             (
                                                 [
@@ -3378,14 +3328,14 @@ class PyastGenPass(Pass):
                                                             func=self.sync(
                                                                 ast3.Name(
                                                                     id="isinstance",
-                                                                    ctx=ast3.Load(),
+                                                                    ctx=_LOAD,
                                                                 )
                                                             ),
                                                             args=[
                                                                 self.sync(
                                                                     ast3.Name(
                                                                         id="i",
-                                                                        ctx=ast3.Load(),
+                                                                        ctx=_LOAD,
                                                                     )
                                                                 ),
                                                                 self.sync(
@@ -3409,14 +3359,14 @@ class PyastGenPass(Pass):
                                                                 value=self.sync(
                                                                     ast3.Name(
                                                                         id="i",
-                                                                        ctx=ast3.Load(),
+                                                                        ctx=_LOAD,
                                                                     ),
                                                                     jac_node=x,
                                                                 ),
                                                                 attr=x.gen.py_ast[
                                                                     0
                                                                 ].left.id,
-                                                                ctx=ast3.Load(),
+                                                                ctx=_LOAD,
                                                             ),
                                                             jac_node=x,
                                                         ),
@@ -3461,11 +3411,9 @@ class PyastGenPass(Pass):
             if i.key:  # TODO: add support for **kwargs in assign_compr
                 keys.append(self.sync(ast3.Constant(i.key.sym_name)))
                 values.append(i.value.gen.py_ast[0])
-        key_tup = self.sync(ast3.Tuple(elts=keys, ctx=ast3.Load()))
-        val_tup = self.sync(ast3.Tuple(elts=values, ctx=ast3.Load()))
-        node.gen.py_ast = [
-            self.sync(ast3.Tuple(elts=[key_tup, val_tup], ctx=ast3.Load()))
-        ]
+        key_tup = self.sync(ast3.Tuple(elts=keys, ctx=_LOAD))
+        val_tup = self.sync(ast3.Tuple(elts=values, ctx=_LOAD))
+        node.gen.py_ast = [self.sync(ast3.Tuple(elts=[key_tup, val_tup], ctx=_LOAD))]
 
     def exit_match_stmt(self, node: ast.MatchStmt) -> None:
         """Sub objects.
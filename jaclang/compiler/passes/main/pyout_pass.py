@@ -11,6 +11,7 @@ import os
 import jaclang.compiler.absyntree as ast
 from jaclang.compiler.constant import Constants as Con
 from jaclang.compiler.passes import Pass
+from jaclang.utils.helpers import is_cache_fresh
 
 
 class PyOutPass(Pass):
@@ -40,9 +41,7 @@ class PyOutPass(Pass):
         ]
         for mod in mods:
             mod_path, out_path_py, out_path_pyc = self.get_output_targets(mod)
-            if os.path.exists(out_path_pyc) and os.path.getmtime(
-                out_path_pyc
-            ) > os.path.getmtime(mod_path):
+            if is_cache_fresh(out_path_pyc, mod_path):
                 continue
             try:
                 self.gen_python(mod, out_path=out_path_py)
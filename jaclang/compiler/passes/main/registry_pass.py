@@ -145,11 +145,7 @@ class RegistryPass(Pass):
 
     def exit_name(self, node: ast.Name) -> None:
         """Save name information. for enum stmts."""
-        if (
-            node.parent
-            and node.parent.parent
-            and node.parent.parent.__class__.__name__ == "Enum"
-        ):
+        if node.parent and node.parent.parent and type(node.parent.parent) is ast.Enum:
             scope = get_sem_scope(node)
             seminfo = SemInfo(node, node.value, None, "")
             if len(self.modules_visited) and self.modules_visited[-1].registry:
@@ -73,6 +73,18 @@ class PyastGenPassTests(TestCaseMicroSuite, AstSyncTestMixin):
 
         self.assertFalse(code_gen.errors_had)
 
+    def test_arch_ref_chain_attr(self) -> None:
+        """Test arch ref chains generate a dotted attribute chain."""
+        code_gen = jac_file_to_pass(
+            self.fixture_abs_path("defs_and_uses.jac"), target=PyastGenPass
+        )
+        chains = {
+            ast3.unparse(i.gen.py_ast[0])
+            for i in code_gen.ir.get_all_sub_nodes(ast.ArchRefChain)
+        }
+        self.assertIn("my_print", chains)
+        self.assertIn("MyPrinter.my_print", chains)
+
     def parent_scrub(self, node: ast.AstNode) -> bool:
         """Validate every node has parent."""
         success = True
@@ -3,6 +3,8 @@
 This is a pass for formatting Jac code.
 """
 
+from typing import Optional
+
 import jaclang.compiler.absyntree as ast
 from jaclang.compiler.passes import Pass
 
@@ -27,7 +29,6 @@ class FuseCommentsPass(Pass):
         """Insert comment tokens into all_tokens."""
         comment_stream = iter(self.comments)  # Iterator for comments
         code_stream = iter(self.all_tokens)  # Iterator for code tokens
-        new_stream: list[ast.Token] = []  # New stream to hold ordered tokens
 
         if not isinstance(self.ir, ast.Module):
             raise self.ice(
@@ -44,48 +45,47 @@ class FuseCommentsPass(Pass):
         except StopIteration:
             next_code = None
 
-        if next_comment and (not next_code or is_comment_next(next_comment, next_code)):
-            self.ir.terminals.insert(0, next_comment)
+        # Comments that follow each code token (None for leading comments)
+        comments_after: dict[Optional[ast.Token], list[ast.CommentToken]] = {}
+        last_code: Optional[ast.Token] = None
 
-        while next_comment or next_code:
+        while next_comment:
             if next_comment and (
                 not next_code or is_comment_next(next_comment, next_code)
             ):
-                # Add the comment to the new stream
-                last_tok = new_stream[-1] if len(new_stream) else None
-                new_stream.append(next_comment)
-                if last_tok:
-                    self.ir.terminals.insert(
-                        self.ir.terminals.index(last_tok) + 1, next_comment
-                    )
+                comments_after.setdefault(last_code, []).append(next_comment)
                 try:
                     next_comment = next(comment_stream)
                 except StopIteration:
                     next_comment = None
             elif next_code:
-                # Add the code token to the new stream
-                new_stream.append(next_code)
+                last_code = next_code
                 try:
                     next_code = next(code_stream)
                 except StopIteration:
                     next_code = None
 
-        # Insert the tokens back into the AST
-        for i, token in enumerate(new_stream):
-            if isinstance(token, ast.CommentToken):
-                if i == 0:
-                    self.ir.add_kids_left([token])
-                else:
-                    prev_token = new_stream[i - 1]
-                    if prev_token.parent is not None:
-                        parent_kids = prev_token.parent.kid
-                        insert_index = parent_kids.index(prev_token) + 1
-                        parent_kids.insert(insert_index, token)
-                        prev_token.parent.set_kids(parent_kids)
-                    else:
-                        raise self.ice(
-                            "Token without parent in AST should be impossible"
-                        )
+        if not comments_after:
+            return
+        leading = comments_after.pop(None, [])
+
+        # Insert the comments into the terminals in a single rebuild
+        terminals: list[ast.Token] = list(leading)
+        for tok in self.ir.terminals:
+            terminals.append(tok)
+            if tok in comments_after:
+                terminals.extend(comments_after[tok])
+        self.ir.terminals = terminals
+
+        # Insert each run of comments back into the AST with one kid rebuild
+        if leading:
+            self.ir.add_kids_left(leading)
+        for code_tok, comments in comments_after.items():
+            if code_tok is None or code_tok.parent is None:
+                raise self.ice("Token without parent in AST should be impossible")
+            code_tok.parent.insert_kids_at_pos(
+                comments, code_tok.parent.kid.index(code_tok) + 1
+            )
 
 
 def is_comment_next(cmt: ast.CommentToken, code: ast.Token) -> bool:
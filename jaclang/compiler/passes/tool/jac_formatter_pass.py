@@ -22,6 +22,10 @@ class JacFormatPass(Pass):
         self.indent_size = 4
         self.indent_level = 0
         self.MAX_LINE_LENGTH = int(float(settings.max_line_length) / 2)
+        self.terminal_pos: dict[ast.Token, int] = {}
+        if isinstance(self.ir, ast.Module):
+            for i, tok in enumerate(self.ir.terminals):
+                self.terminal_pos.setdefault(tok, i)
 
     def enter_node(self, node: ast.AstNode) -> None:
         """Enter node."""
@@ -32,17 +36,17 @@ class JacFormatPass(Pass):
         """Token before."""
         if not isinstance(self.ir, ast.Module):
             raise self.ice("IR must be module. Impossible")
-        if self.ir.terminals.index(node) == 0:
+        if not (pos := self.terminal_pos[node]):
             return None
-        return self.ir.terminals[self.ir.terminals.index(node) - 1]
+        return self.ir.terminals[pos - 1]
 
     def token_after(self, node: ast.Token) -> Optional[ast.Token]:
         """Token after."""
         if not isinstance(self.ir, ast.Module):
             raise self.ice("IR must be module. Impossible")
-        if self.ir.terminals.index(node) == len(self.ir.terminals) - 1:
+        if (pos := self.terminal_pos[node]) == len(self.ir.terminals) - 1:
             return None
-        return self.ir.terminals[self.ir.terminals.index(node) + 1]
+        return self.ir.terminals[pos + 1]
 
     def indent_str(self) -> str:
         """Return string for indent."""
@@ -1524,17 +1528,17 @@ class JacFormatPass(Pass):
         test_str = ""
         for i in node.values:
             test_str += f"{i.gen.jac}"
-            if i != end:
+            if i is not end:
                 test_str += f" {node.op.value} "
 
         # Check if line break is needed
         if self.is_line_break_needed(test_str):
             for i in node.values:
-                if i != end:
+                if i is not end:
                     self.emit_ln(node, f"{i.gen.jac}")
                 else:
                     self.emit(node, f"{i.gen.jac}")
-                if i != end:
+                if i is not end:
                     self.emit(
                         node,
                         " " * self.indent_size + f"{node.op.value} ",
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import ast as ast3
+import sys
 from typing import Optional, Sequence
 
 import jaclang.compiler.absyntree as ast
@@ -15,6 +16,8 @@ from jaclang.utils.treeprinter import dotgen_symtab_tree, print_symtab_tree
 class Symbol:
     """Symbol."""
 
+    __slots__ = ("defn", "uses", "access", "parent_tab")
+
     def __init__(
         self,
         defn: ast.NameAtom,
@@ -51,8 +54,7 @@ class Symbol:
         while current_tab is not None:
             out.append(current_tab.name)
             current_tab = current_tab.parent
-        out.reverse()
-        return ".".join(out)
+        return ".".join(reversed(out))
 
     def add_defn(self, node: ast.NameAtom) -> None:
         """Add defn."""
@@ -72,6 +74,21 @@ class Symbol:
 class SymbolTable:
     """Symbol Table."""
 
+    __slots__ = (
+        "name",
+        "owner",
+        "parent",
+        "kid",
+        "tab",
+        "inherit",
+        "lookup_cache",
+        "cache_version",
+    )
+
+    # Bumped on every change to any table's names or inheritance, which
+    # invalidates the lookup caches of all tables.
+    version = 0
+
     def __init__(
         self, name: str, owner: ast.AstNode, parent: Optional[SymbolTable] = None
     ) -> None:
@@ -82,6 +99,13 @@ class SymbolTable:
         self.kid: list[SymbolTable] = []
         self.tab: dict[str, Symbol] = {}
         self.inherit: list[SymbolTable] = []
+        self.lookup_cache: dict[tuple[str, bool], Optional[Symbol]] = {}
+        self.cache_version = SymbolTable.version
+
+    @staticmethod
+    def mark_changed() -> None:
+        """Invalidate cached lookups of all symbol tables."""
+        SymbolTable.version += 1
 
     def get_parent(self) -> Optional[SymbolTable]:
         """Get parent."""
@@ -89,14 +113,28 @@ class SymbolTable:
 
     def lookup(self, name: str, deep: bool = True) -> Optional[Symbol]:
         """Lookup a variable in the symbol table."""
-        if name in self.tab:
-            return self.tab[name]
-        for i in self.inherit:
-            found = i.lookup(name, deep=False)
-            if found:
-                return found
-        if deep and self.parent:
-            return self.parent.lookup(name, deep)
+        if self.cache_version != SymbolTable.version:
+            self.lookup_cache.clear()
+            self.cache_version = SymbolTable.version
+        key = (name, deep)
+        if key in self.lookup_cache:
+            return self.lookup_cache[key]
+        self.lookup_cache[key] = found = self._lookup(name, deep)
+        return found
+
+    def _lookup(self, name: str, deep: bool) -> Optional[Symbol]:
+        """Resolve a name by walking this table, its bases and its parents."""
+        cur: Optional[SymbolTable] = self
+        while cur:
+            if (sym := cur.tab.get(name)) is not None:
+                return sym
+            for i in cur.inherit:
+                found = i.lookup(name, deep=False)
+                if found:
+                    return found
+            if not deep:
+                return None
+            cur = cur.parent
         return None
 
     def insert(
@@ -110,13 +148,14 @@ class SymbolTable:
         Returns original symbol as collision if single check fails, none otherwise.
         Also updates node.sym to create pointer to symbol.
         """
-        collision = (
-            self.tab[node.sym_name].defn[-1]
-            if single and node.sym_name in self.tab
-            else None
-        )
-        if node.sym_name not in self.tab:
-            self.tab[node.sym_name] = Symbol(
+        # Names such as self or here recur in most scopes, interning them lets
+        # all the tables share one key object.
+        name = sys.intern(node.sym_name)
+        sym = self.tab.get(name)
+        collision = sym.defn[-1] if single and sym else None
+        if sym is None:
+            SymbolTable.mark_changed()
+            sym = self.tab[name] = Symbol(
                 defn=node.name_spec,
                 access=(
                     access_spec
@@ -126,8 +165,8 @@ class SymbolTable:
                 parent_tab=self,
             )
         else:
-            self.tab[node.sym_name].add_defn(node.name_spec)
-        node.name_spec.sym = self.tab[node.sym_name]
+            sym.add_defn(node.name_spec)
+        node.name_spec.sym = sym
         return collision
 
     def find_scope(self, name: str) -> Optional[SymbolTable]:
@@ -154,7 +193,7 @@ class SymbolTable:
         single_decl: Optional[str] = None,
     ) -> Optional[Symbol]:
         """Insert into symbol table."""
-        if node.sym and self == node.sym.parent_tab:
+        if node.sym and self is node.sym.parent_tab:
             return node.sym
         self.insert(node=node, single=single_decl is not None, access_spec=access_spec)
         self.update_py_ctx_for_def(node)
@@ -253,6 +292,7 @@ class SymbolTable:
                     and found
                 ):
                     self.inherit.append(found.decl.sym_tab)
+                    SymbolTable.mark_changed()
                     base_cls.name_spec.name_of = found.decl.name_of
 
     def pp(self, depth: Optional[int] = None) -> str:
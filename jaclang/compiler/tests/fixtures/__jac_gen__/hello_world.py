@@ -0,0 +1,5 @@
+""" Basic Hello World function """
+from __future__ import annotations
+
+def hello() -> None:
+    return 'Hello World!'
\ No newline at end of file
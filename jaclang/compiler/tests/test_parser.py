@@ -143,5 +143,17 @@ class TestLarkParser(TestCaseMicroSuite):
             if cls.__name__ not in exclude:
                 self.assertIn("normalize", cls.__dict__)
 
+    def test_ast_nodes_compare_by_identity(self) -> None:
+        """Test AST nodes keep identity equality and hashing."""
+        import jaclang.compiler.absyntree as ast
+
+        prse = JacParser(input_ir=JacSource("glob a = 5, b = 5;", mod_path=""))
+        ints = prse.ir.get_all_sub_nodes(ast.Int)
+        self.assertEqual(len(ints), 2)
+        self.assertNotEqual(ints[0], ints[1])
+        self.assertEqual(len(set(ints)), 2)
+        with self.assertRaises(TypeError):
+            type("Bad", (ast.Name,), {"__eq__": lambda self, other: True})
+
 
 TestLarkParser.self_attach_micro_tests()
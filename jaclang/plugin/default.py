@@ -392,7 +392,7 @@ class JacFeatureDefaults:
         """Jac's ignore stmt feature."""
         if isinstance(walker, WalkerArchitype):
             return walker.__jac__.ignore_node(
-                (i.__jac__ for i in expr) if isinstance(expr, list) else [expr.__jac__]
+                (i.__jac__ for i in expr) if isinstance(expr, list) else (expr.__jac__,)
             )
         else:
             raise TypeError("Invalid walker object")
@@ -412,7 +412,7 @@ class JacFeatureDefaults:
         """Jac's visit stmt feature."""
         if isinstance(walker, WalkerArchitype):
             return walker.__jac__.visit_node(
-                (i.__jac__ for i in expr) if isinstance(expr, list) else [expr.__jac__]
+                (i.__jac__ for i in expr) if isinstance(expr, list) else (expr.__jac__,)
             )
         else:
             raise TypeError("Invalid walker object")
@@ -442,21 +442,27 @@ class JacFeatureDefaults:
             else target_obj if target_obj else None
         )
         if edges_only:
-            connected_edges: list[EdgeArchitype] = []
+            connected_edges: dict[EdgeArchitype, None] = {}
             for node in node_obj:
-                connected_edges += node.__jac__.get_edges(
-                    dir, filter_func, target_obj=targ_obj_set
+                connected_edges.update(
+                    dict.fromkeys(
+                        node.__jac__.iter_edges(
+                            dir, filter_func, target_obj=targ_obj_set
+                        )
+                    )
                 )
-            return list(set(connected_edges))
+            return list(connected_edges)
         else:
-            connected_nodes: list[NodeArchitype] = []
+            connected_nodes: dict[NodeArchitype, None] = {}
             for node in node_obj:
-                connected_nodes.extend(
-                    node.__jac__.edges_to_nodes(
-                        dir, filter_func, target_obj=targ_obj_set
+                connected_nodes.update(
+                    dict.fromkeys(
+                        node.__jac__.iter_nodes(
+                            dir, filter_func, target_obj=targ_obj_set
+                        )
                     )
                 )
-            return list(set(connected_nodes))
+            return list(connected_nodes)
 
     @staticmethod
     @hookimpl
@@ -475,14 +481,20 @@ class JacFeatureDefaults:
         edges = []
 
         root = Jac.get_root().__jac__
+        # resolved on first accessible left node and reused for the rest
+        rights: Optional[list[NodeAnchor]] = None
 
         for i in left:
             _left = i.__jac__
             if root.has_connect_access(_left):
-                for j in right:
-                    _right = j.__jac__
-                    if root.has_connect_access(_right):
-                        edges.append(edge_spec(_left, _right))
+                if rights is None:
+                    rights = [
+                        _right
+                        for j in right
+                        if root.has_connect_access(_right := j.__jac__)
+                    ]
+                for _right in rights:
+                    edges.append(edge_spec(_left, _right))
         return right if not edges_only else edges
 
     @staticmethod
@@ -574,8 +586,6 @@ class JacFeatureDefaults:
                         raise ValueError(f"Invalid attribute: {fld}")
             if source.persistent or target.persistent:
                 edge.__jac__.save()
-                target.save()
-                source.save()
             return edge
 
         return builder
@@ -862,7 +872,7 @@ class JacBuiltin:
     ) -> str:
         """Generate Dot file for visualizing nodes and edges."""
         edge_type = edge_type if edge_type else []
-        visited_nodes: list[NodeArchitype] = []
+        visited_nodes: dict[NodeArchitype, int] = {}
         node_depths: dict[NodeArchitype, int] = {node: 0}
         queue: list = [[node, 0]]
         connections: list[tuple[NodeArchitype, NodeArchitype, EdgeArchitype]] = []
@@ -870,7 +880,7 @@ class JacBuiltin:
         def dfs(node: NodeArchitype, cur_depth: int) -> None:
             """Depth first search."""
             if node not in visited_nodes:
-                visited_nodes.append(node)
+                visited_nodes[node] = len(visited_nodes)
                 traverse_graph(
                     node,
                     cur_depth,
@@ -892,7 +902,7 @@ class JacBuiltin:
             while queue:
                 current_node, cur_depth = queue.pop(0)
                 if current_node not in visited_nodes:
-                    visited_nodes.append(current_node)
+                    visited_nodes[current_node] = len(visited_nodes)
                     traverse_graph(
                         current_node,
                         cur_depth,
@@ -910,27 +920,29 @@ class JacBuiltin:
                     )
         else:
             dfs(node, cur_depth=0)
-        dot_content = (
+        dot_lines = [
             'digraph {\nnode [style="filled", shape="ellipse", '
             'fillcolor="invis", fontcolor="black"];\n'
-        )
+        ]
         for source, target, edge in connections:
-            dot_content += (
-                f"{visited_nodes.index(source)} -> {visited_nodes.index(target)} "
+            dot_lines.append(
+                f"{visited_nodes[source]} -> {visited_nodes[target]} "
                 f' [label="{html.escape(str(edge.__jac__.architype))} "];\n'
             )
-        for node_ in visited_nodes:
+        for node_, idx in visited_nodes.items():
             color = (
                 colors[node_depths[node_]] if node_depths[node_] < 25 else colors[24]
             )
-            dot_content += (
-                f'{visited_nodes.index(node_)} [label="{html.escape(str(node_.__jac__.architype))}"'
+            dot_lines.append(
+                f'{idx} [label="{html.escape(str(node_.__jac__.architype))}"'
                 f'fillcolor="{color}"];\n'
             )
+        dot_lines.append("}")
+        dot_content = "".join(dot_lines)
         if dot_file:
             with open(dot_file, "w") as f:
-                f.write(dot_content + "}")
-        return dot_content + "}"
+                f.write(dot_content)
+        return dot_content
 
 
 class JacCmdDefaults:
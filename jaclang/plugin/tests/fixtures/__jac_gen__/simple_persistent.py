@@ -0,0 +1,51 @@
+from __future__ import annotations
+from jaclang.plugin.feature import JacFeature as _Jac
+from jaclang.plugin.builtin import *
+from dataclasses import dataclass as __jac_dataclass__
+
+@_Jac.make_node(on_entry=[], on_exit=[])
+@__jac_dataclass__(eq=False)
+class a(_Jac.Node):
+    name: str
+
+@_Jac.make_node(on_entry=[], on_exit=[])
+@__jac_dataclass__(eq=False)
+class b(_Jac.Node):
+    name: str
+
+@_Jac.make_walker(on_entry=[_Jac.DSFunc('setup', _Jac.RootType), _Jac.DSFunc('ata', a)], on_exit=[])
+@__jac_dataclass__(eq=False)
+class create(_Jac.Walker):
+
+    def setup(self, _jac_here_: _Jac.RootType) -> None:
+        na = _Jac.connect(left=_jac_here_, right=a(name='node a'), edge_spec=_Jac.build_edge(is_undirected=False, conn_type=None, conn_assign=None))
+        if _Jac.visit_node(self, na):
+            pass
+
+    def ata(self, _jac_here_: a) -> None:
+        _Jac.connect(left=_jac_here_, right=b(name='node b'), edge_spec=_Jac.build_edge(is_undirected=False, conn_type=None, conn_assign=None))
+
+@_Jac.make_walker(on_entry=[_Jac.DSFunc('at_root', _Jac.RootType), _Jac.DSFunc('at_a', a), _Jac.DSFunc('at_b', b)], on_exit=[])
+@__jac_dataclass__(eq=False)
+class traverse(_Jac.Walker):
+
+    def at_root(self, _jac_here_: _Jac.RootType) -> None:
+        if _Jac.visit_node(self, _Jac.edge_ref(_jac_here_, target_obj=None, dir=_Jac.EdgeDir.OUT, filter_func=None, edges_only=False)):
+            pass
+
+    def at_a(self, _jac_here_: a) -> None:
+        print(_jac_here_.name)
+        if _Jac.visit_node(self, _Jac.edge_ref(_jac_here_, target_obj=None, dir=_Jac.EdgeDir.OUT, filter_func=None, edges_only=False)):
+            pass
+
+    def at_b(self, _jac_here_: b) -> None:
+        print(_jac_here_.name)
+
+@_Jac.make_walker(on_entry=[_Jac.DSFunc('at_root', _Jac.RootType)], on_exit=[])
+@__jac_dataclass__(eq=False)
+class indirect_ref(_Jac.Walker):
+
+    def at_root(self, _jac_here_: _Jac.RootType) -> None:
+        node_as = _Jac.edge_ref(_jac_here_, target_obj=None, dir=_Jac.EdgeDir.OUT, filter_func=None, edges_only=False)
+        print(_Jac.edge_ref(node_as, target_obj=None, dir=_Jac.EdgeDir.OUT, filter_func=None, edges_only=False))
+        print(_Jac.edge_ref(node_as, target_obj=None, dir=_Jac.EdgeDir.OUT, filter_func=None, edges_only=True))
\ No newline at end of file
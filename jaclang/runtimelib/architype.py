@@ -2,12 +2,13 @@
 
 from __future__ import annotations
 
-from dataclasses import asdict, dataclass, field, fields, is_dataclass
+from collections import deque
+from dataclasses import dataclass, field, fields, is_dataclass
 from enum import IntEnum
 from logging import getLogger
 from pickle import dumps
 from types import UnionType
-from typing import Any, Callable, ClassVar, Iterable, Optional, TypeVar
+from typing import Any, Callable, ClassVar, Iterable, Iterator, Optional, TypeVar
 from uuid import UUID, uuid4
 
 from jaclang.compiler.constant import EdgeDir
@@ -154,6 +155,7 @@ class Anchor:
             return AccessLevel.WRITE
 
         access_level = AccessLevel.NO_ACCESS
+        jroot_id = str(jroot.id)
 
         # if target anchor have set access.all
         if (to_access := to.access).all > AccessLevel.NO_ACCESS:
@@ -165,13 +167,13 @@ class Anchor:
             if to_root.access.all > access_level:
                 access_level = to_root.access.all
 
-            level = to_root.access.roots.check(str(jroot.id))
+            level = to_root.access.roots.check(jroot_id)
             if level > AccessLevel.NO_ACCESS and access_level == AccessLevel.NO_ACCESS:
                 access_level = level
 
         # if target anchor have set allowed roots
         # if current root is allowed to target anchor
-        level = to_access.roots.check(str(jroot.id))
+        level = to_access.roots.check(jroot_id)
         if level > AccessLevel.NO_ACCESS and access_level == AccessLevel.NO_ACCESS:
             access_level = level
 
@@ -275,15 +277,16 @@ class Anchor:
         return f"{self.__class__.__name__}({attrs})"
 
     def report(self) -> AnchorReport:
-        """Report Anchor."""
-        return AnchorReport(
-            id=self.id.hex,
-            context=(
-                asdict(self.architype)
-                if is_dataclass(self.architype) and not isinstance(self.architype, type)
-                else {}
-            ),
-        )
+        """Report Anchor.
+
+        The context is shallow: it maps field names to the architype's own
+        values, without converting or copying them.
+        """
+        architype = self.architype
+        context = {
+            name: getattr(architype, name) for name in architype.__jac_fields__()
+        }
+        return AnchorReport(id=self.id.hex, context=context)
 
     def __hash__(self) -> int:
         """Override hash for anchor."""
@@ -311,33 +314,17 @@ class NodeAnchor(Anchor):
         target_obj: Optional[list[NodeArchitype]],
     ) -> list[EdgeArchitype]:
         """Get edges connected to this node."""
-        from jaclang.plugin.feature import JacFeature as Jac
+        return list(self.iter_edges(dir, filter_func, target_obj))
 
-        root = Jac.get_root().__jac__
-        ret_edges: list[EdgeArchitype] = []
-        for anchor in self.edges:
-            if (
-                (source := anchor.source)
-                and (target := anchor.target)
-                and (not filter_func or filter_func([anchor.architype]))
-                and source.architype
-                and target.architype
-            ):
-                if (
-                    dir in [EdgeDir.OUT, EdgeDir.ANY]
-                    and self == source
-                    and (not target_obj or target.architype in target_obj)
-                    and root.has_read_access(target)
-                ):
-                    ret_edges.append(anchor.architype)
-                if (
-                    dir in [EdgeDir.IN, EdgeDir.ANY]
-                    and self == target
-                    and (not target_obj or source.architype in target_obj)
-                    and root.has_read_access(source)
-                ):
-                    ret_edges.append(anchor.architype)
-        return ret_edges
+    def iter_edges(
+        self,
+        dir: EdgeDir,
+        filter_func: Optional[Callable[[list[EdgeArchitype]], list[EdgeArchitype]]],
+        target_obj: Optional[list[NodeArchitype]],
+    ) -> Iterator[EdgeArchitype]:
+        """Yield edges connected to this node."""
+        for edge, _ in self._connected_anchors(dir, filter_func, target_obj):
+            yield edge.architype
 
     def edges_to_nodes(
         self,
@@ -346,10 +333,30 @@ class NodeAnchor(Anchor):
         target_obj: Optional[list[NodeArchitype]],
     ) -> list[NodeArchitype]:
         """Get set of nodes connected to this node."""
+        return list(self.iter_nodes(dir, filter_func, target_obj))
+
+    def iter_nodes(
+        self,
+        dir: EdgeDir,
+        filter_func: Optional[Callable[[list[EdgeArchitype]], list[EdgeArchitype]]],
+        target_obj: Optional[list[NodeArchitype]],
+    ) -> Iterator[NodeArchitype]:
+        """Yield nodes connected to this node."""
+        for _, node in self._connected_anchors(dir, filter_func, target_obj):
+            yield node.architype
+
+    def _connected_anchors(
+        self,
+        dir: EdgeDir,
+        filter_func: Optional[Callable[[list[EdgeArchitype]], list[EdgeArchitype]]],
+        target_obj: Optional[list[NodeArchitype]],
+    ) -> Iterator[tuple[EdgeAnchor, NodeAnchor]]:
+        """Yield accessible edges of this node paired with the node on the other end."""
         from jaclang.plugin.feature import JacFeature as Jac
 
         root = Jac.get_root().__jac__
-        ret_edges: list[NodeArchitype] = []
+        out_dir = dir is not EdgeDir.IN
+        in_dir = dir is not EdgeDir.OUT
         for anchor in self.edges:
             if (
                 (source := anchor.source)
@@ -359,20 +366,19 @@ class NodeAnchor(Anchor):
                 and target.architype
             ):
                 if (
-                    dir in [EdgeDir.OUT, EdgeDir.ANY]
+                    out_dir
                     and self == source
                     and (not target_obj or target.architype in target_obj)
                     and root.has_read_access(target)
                 ):
-                    ret_edges.append(target.architype)
+                    yield anchor, target
                 if (
-                    dir in [EdgeDir.IN, EdgeDir.ANY]
+                    in_dir
                     and self == target
                     and (not target_obj or source.architype in target_obj)
                     and root.has_read_access(source)
                 ):
-                    ret_edges.append(source.architype)
-        return ret_edges
+                    yield anchor, source
 
     def remove_edge(self, edge: EdgeAnchor) -> None:
         """Remove reference without checking sync status."""
@@ -388,21 +394,25 @@ class NodeAnchor(Anchor):
         unique_node_id_dict = {}
 
         collect_node_connections(self, visited_nodes, connections)
-        dot_content = 'digraph {\nnode [style="filled", shape="ellipse", fillcolor="invis", fontcolor="black"];\n'
+        dot_lines = [
+            'digraph {\nnode [style="filled", shape="ellipse", fillcolor="invis", fontcolor="black"];\n'
+        ]
         for idx, i in enumerate([nodes_.architype for nodes_ in visited_nodes]):
             unique_node_id_dict[i] = (i.__class__.__name__, str(idx))
-            dot_content += f'{idx} [label="{i}"];\n'
-        dot_content += 'edge [color="gray", style="solid"];\n'
+            dot_lines.append(f'{idx} [label="{i}"];\n')
+        dot_lines.append('edge [color="gray", style="solid"];\n')
 
-        for pair in list(set(connections)):
-            dot_content += (
-                f"{unique_node_id_dict[pair[0]][1]} -> {unique_node_id_dict[pair[1]][1]}"
-                f' [label="{pair[2]}"];\n'
+        for source, target, label in connections:
+            dot_lines.append(
+                f"{unique_node_id_dict[source][1]} -> {unique_node_id_dict[target][1]}"
+                f' [label="{label}"];\n'
             )
+        dot_lines.append("}")
+        dot_content = "".join(dot_lines)
         if dot_file:
             with open(dot_file, "w") as f:
-                f.write(dot_content + "}")
-        return dot_content + "}"
+                f.write(dot_content)
+        return dot_content
 
     def spawn_call(self, walk: WalkerAnchor) -> WalkerArchitype:
         """Invoke data spatial call."""
@@ -444,6 +454,20 @@ class EdgeAnchor(Anchor):
         self.source.edges.append(self)
         self.target.edges.append(self)
 
+    def save(self) -> None:
+        """Save Edge Anchor along with its source and target."""
+        from jaclang.plugin.feature import JacFeature as Jac
+
+        jctx = Jac.get_context()
+        mem = jctx.mem
+        root_id = jctx.root.id
+
+        # source and target are the same anchor on self-loops
+        for anchor in dict.fromkeys((self, self.source, self.target)):
+            anchor.persistent = True
+            anchor.root = root_id
+            mem.set(anchor.id, anchor)
+
     def detach(self) -> None:
         """Detach edge from nodes."""
         self.source.remove_edge(self)
@@ -485,8 +509,8 @@ class WalkerAnchor(Anchor):
 
     architype: WalkerArchitype
     path: list[Anchor] = field(default_factory=list)
-    next: list[Anchor] = field(default_factory=list)
-    ignores: list[Anchor] = field(default_factory=list)
+    next: deque[Anchor] = field(default_factory=deque)
+    ignores: set[Anchor] = field(default_factory=set)
     disengaged: bool = False
 
     def visit_node(self, anchors: Iterable[NodeAnchor | EdgeAnchor]) -> bool:
@@ -509,10 +533,10 @@ class WalkerAnchor(Anchor):
         for anchor in anchors:
             if anchor not in self.ignores:
                 if isinstance(anchor, NodeAnchor):
-                    self.ignores.append(anchor)
+                    self.ignores.add(anchor)
                 elif isinstance(anchor, EdgeAnchor):
                     if target := anchor.target:
-                        self.ignores.append(target)
+                        self.ignores.add(target)
                     else:
                         raise ValueError("Edge has no target.")
         return len(self.ignores) > before_len
@@ -525,42 +549,19 @@ class WalkerAnchor(Anchor):
         """Invoke data spatial call."""
         if walker := self.architype:
             self.path = []
-            self.next = [node]
-            while len(self.next):
-                if current_node := self.next.pop(0).architype:
-                    for i in current_node._jac_entry_funcs_:
-                        if not i.trigger or isinstance(walker, i.trigger):
-                            if i.func:
-                                i.func(current_node, walker)
-                            else:
-                                raise ValueError(f"No function {i.name} to call.")
-                        if self.disengaged:
-                            return walker
-                    for i in walker._jac_entry_funcs_:
-                        if not i.trigger or isinstance(current_node, i.trigger):
-                            if i.func:
-                                i.func(walker, current_node)
-                            else:
-                                raise ValueError(f"No function {i.name} to call.")
-                        if self.disengaged:
-                            return walker
-                    for i in walker._jac_exit_funcs_:
-                        if not i.trigger or isinstance(current_node, i.trigger):
-                            if i.func:
-                                i.func(walker, current_node)
-                            else:
-                                raise ValueError(f"No function {i.name} to call.")
-                        if self.disengaged:
-                            return walker
-                    for i in current_node._jac_exit_funcs_:
-                        if not i.trigger or isinstance(walker, i.trigger):
-                            if i.func:
-                                i.func(current_node, walker)
-                            else:
-                                raise ValueError(f"No function {i.name} to call.")
+            self.next = deque([node])
+            while self.next:
+                if current_node := self.next.popleft().architype:
+                    for i, walker_first in walker.__jac_abilities__(type(current_node)):
+                        if not i.func:
+                            raise ValueError(f"No function {i.name} to call.")
+                        if walker_first:
+                            i.func(walker, current_node)
+                        else:
+                            i.func(current_node, walker)
                         if self.disengaged:
                             return walker
-            self.ignores = []
+            self.ignores = set()
             return walker
         raise Exception(f"Invalid Reference {self.id}")
 
@@ -570,11 +571,21 @@ class Architype:
 
     _jac_entry_funcs_: ClassVar[list[DSFunc]]
     _jac_exit_funcs_: ClassVar[list[DSFunc]]
+    _jac_fields_: ClassVar[tuple[str, ...]]
 
     def __init__(self) -> None:
         """Create default architype."""
         self.__jac__ = Anchor(architype=self)
 
+    @classmethod
+    def __jac_fields__(cls) -> tuple[str, ...]:
+        """Get the cached dataclass field names of the architype."""
+        if "_jac_fields_" not in cls.__dict__:
+            cls._jac_fields_ = (
+                tuple(f.name for f in fields(cls)) if is_dataclass(cls) else ()
+            )
+        return cls._jac_fields_
+
     def __repr__(self) -> str:
         """Override repr for architype."""
         return f"{self.__class__.__name__}"
@@ -611,6 +622,41 @@ class WalkerArchitype(Architype):
     """Walker Architype Protocol."""
 
     __jac__: WalkerAnchor
+    _jac_abilities_: ClassVar[dict[type, list[tuple[DSFunc, bool]]]]
+
+    @classmethod
+    def __jac_abilities__(cls, node_cls: type[Architype]) -> list[tuple[DSFunc, bool]]:
+        """Get the cached abilities triggered when this walker visits a node type.
+
+        Abilities are in call order: node entry, walker entry, walker exit and
+        node exit, each paired with whether the walker is its first argument.
+        """
+        if "_jac_abilities_" not in cls.__dict__:
+            cls._jac_abilities_ = {}
+        if (abilities := cls._jac_abilities_.get(node_cls)) is None:
+            abilities = cls._jac_abilities_[node_cls] = [
+                *(
+                    (i, False)
+                    for i in node_cls._jac_entry_funcs_
+                    if not i.trigger or issubclass(cls, i.trigger)
+                ),
+                *(
+                    (i, True)
+                    for i in cls._jac_entry_funcs_
+                    if not i.trigger or issubclass(node_cls, i.trigger)
+                ),
+                *(
+                    (i, True)
+                    for i in cls._jac_exit_funcs_
+                    if not i.trigger or issubclass(node_cls, i.trigger)
+                ),
+                *(
+                    (i, False)
+                    for i in node_cls._jac_exit_funcs_
+                    if not i.trigger or issubclass(cls, i.trigger)
+                ),
+            ]
+        return abilities
 
     def __init__(self) -> None:
         """Create walker architype."""
@@ -625,7 +671,7 @@ class GenericEdge(EdgeArchitype):
     _jac_exit_funcs_: ClassVar[list[DSFunc]] = []
 
 
-@dataclass(eq=False)
+@dataclass(init=False, eq=False)
 class Root(NodeArchitype):
     """Generic Root Node."""
 
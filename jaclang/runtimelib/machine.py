@@ -12,6 +12,7 @@ from jaclang.compiler.absyntree import Module
 from jaclang.compiler.compile import compile_jac
 from jaclang.compiler.constant import Constants as Con
 from jaclang.runtimelib.architype import EdgeArchitype, NodeArchitype, WalkerArchitype
+from jaclang.utils.helpers import is_cache_fresh
 from jaclang.utils.log import logging
 
 
@@ -136,12 +137,14 @@ class JacProgram:
         cachable: bool = True,
     ) -> Optional[types.CodeType]:
         """Get the bytecode for a specific module."""
+        if full_target in self.bytecode:
+            return marshal.loads(self.bytecode[full_target])
         if self.mod_bundle and isinstance(self.mod_bundle, Module):
             codeobj = self.mod_bundle.mod_deps[full_target].gen.py_bytecode
             return marshal.loads(codeobj) if isinstance(codeobj, bytes) else None
         gen_dir = os.path.join(caller_dir, Con.JAC_GEN_DIR)
         pyc_file_path = os.path.join(gen_dir, module_name + ".jbc")
-        if cachable and os.path.exists(pyc_file_path):
+        if cachable and is_cache_fresh(pyc_file_path, full_target):
             with open(pyc_file_path, "rb") as f:
                 return marshal.load(f)
 
@@ -84,8 +84,12 @@ class ShelfStorage(Memory[UUID, Anchor]):
 
             root = Jac.get_root().__jac__
 
+            # collect every pending write first and flush them in one batch
+            removals: list[str] = []
+            updates: dict[str, Anchor] = {}
+
             for anchor in self.__gc__:
-                self.__shelf__.pop(str(anchor.id), None)
+                removals.append(str(anchor.id))
                 self.__mem__.pop(anchor.id, None)
 
             for d in self.__mem__.values():
@@ -99,23 +103,27 @@ class ShelfStorage(Memory[UUID, Anchor]):
                             and root.has_connect_access(d)
                         ):
                             if not d.edges:
-                                self.__shelf__.pop(_id, None)
+                                removals.append(_id)
                                 continue
                             p_d.edges = d.edges
 
                         if root.has_write_access(d):
-                            if hash(dumps(p_d.access)) != hash(dumps(d.access)):
+                            if p_d.access != d.access:
                                 p_d.access = d.access
                             if hash(dumps(d.architype)) != hash(dumps(d.architype)):
                                 p_d.architype = d.architype
 
-                        self.__shelf__[_id] = p_d
+                        updates[_id] = p_d
                     elif not (
                         isinstance(d, NodeAnchor)
                         and not isinstance(d.architype, Root)
                         and not d.edges
                     ):
-                        self.__shelf__[_id] = d
+                        updates[_id] = d
+
+            for _id in removals:
+                self.__shelf__.pop(_id, None)
+            self.__shelf__.update(updates)
 
             self.__shelf__.close()
         super().close()
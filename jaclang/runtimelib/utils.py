@@ -33,20 +33,25 @@ def collect_node_connections(
     connections: set,
 ) -> None:
     """Nodes and edges representing the graph are collected in visited_nodes and connections."""
-    if current_node not in visited_nodes:
-        visited_nodes.add(current_node)
-        edges = current_node.edges
-        for edge_ in edges:
+    visit = visited_nodes.add
+    connect = connections.add
+    stack = [current_node]
+    while stack:
+        current_node = stack.pop()
+        if current_node in visited_nodes:
+            continue
+        visit(current_node)
+        for edge_ in current_node.edges:
             target = edge_.target
             if target:
-                connections.add(
+                connect(
                     (
                         current_node.architype,
                         target.architype,
                         edge_.__class__.__name__,
                     )
                 )
-                collect_node_connections(target, visited_nodes, connections)
+                stack.append(target)
 
 
 def traverse_graph(
@@ -57,7 +62,7 @@ def traverse_graph(
     traverse: bool,
     connections: list,
     node_depths: dict[NodeArchitype, int],
-    visited_nodes: list,
+    visited_nodes: dict[NodeArchitype, int],
     queue: list,
     bfs: bool,
     dfs: Callable,
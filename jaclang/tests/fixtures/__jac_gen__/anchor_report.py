@@ -0,0 +1,20 @@
+"""Anchor report context is a shallow view of the architype fields."""
+from __future__ import annotations
+from jaclang.plugin.feature import JacFeature as _Jac
+from jaclang.plugin.builtin import *
+from dataclasses import dataclass as __jac_dataclass__
+
+@_Jac.make_obj(on_entry=[], on_exit=[])
+@__jac_dataclass__(eq=False)
+class Inner(_Jac.Obj):
+    x: int = _Jac.has_instance_default(gen_func=lambda: 1)
+
+@_Jac.make_node(on_entry=[], on_exit=[])
+@__jac_dataclass__(eq=False)
+class Item(_Jac.Node):
+    tags: list = _Jac.has_instance_default(gen_func=lambda: [])
+    inner: Inner = _Jac.has_instance_default(gen_func=lambda: Inner())
+item = Item()
+context = item.__jac__.report().context
+print(list(context.keys()))
+print(context['tags'] is item.tags, context['inner'] is item.inner)
\ No newline at end of file
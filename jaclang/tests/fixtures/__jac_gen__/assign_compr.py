@@ -0,0 +1,17 @@
+"""test file for assign_compr."""
+from __future__ import annotations
+from jaclang import jac_import as __jac_import__
+import typing as _jac_typ
+from jaclang.plugin.feature import JacFeature as _Jac
+from jaclang.plugin.builtin import *
+from dataclasses import dataclass as __jac_dataclass__
+
+@_Jac.make_obj(on_entry=[], on_exit=[])
+@__jac_dataclass__(eq=False)
+class MyObj(_Jac.Obj):
+    apple: int = _Jac.has_instance_default(gen_func=lambda: 0)
+    banana: int = _Jac.has_instance_default(gen_func=lambda: 0)
+x = MyObj()
+y = MyObj()
+mvar = _Jac.assign_compr([x, y], (('apple', 'banana'), (5, 7)))
+print(mvar)
\ No newline at end of file
@@ -0,0 +1,11 @@
+from __future__ import annotations
+from jaclang.plugin.feature import JacFeature as _Jac
+from jaclang.plugin.builtin import *
+
+def speak() -> None:
+    HasFault()
+
+@_Jac.create_test
+@_Jac.impl_patch_filename(file_loc='/root/package/jaclang/tests/fixtures/baddy.test.jac')
+def test_baddy(_jac_check) -> None:
+    print(5 / 0)
\ No newline at end of file
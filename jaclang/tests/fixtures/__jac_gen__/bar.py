@@ -0,0 +1,42 @@
+from __future__ import annotations
+from jaclang import jac_import as __jac_import__
+import typing as _jac_typ
+from jaclang.plugin.feature import JacFeature as _Jac
+from jaclang.plugin.builtin import *
+from dataclasses import dataclass as __jac_dataclass__
+
+@_Jac.make_node(on_entry=[], on_exit=[])
+@__jac_dataclass__(eq=False)
+class Item(_Jac.Node):
+    value: int = _Jac.has_instance_default(gen_func=lambda: 0)
+
+@_Jac.make_edge(on_entry=[], on_exit=[])
+@__jac_dataclass__(eq=False)
+class Link(_Jac.Edge):
+    pass
+
+@_Jac.make_walker(on_entry=[_Jac.DSFunc('start', _Jac.RootType | Item), _Jac.DSFunc('walk', Item)], on_exit=[])
+@__jac_dataclass__(eq=False)
+class bar_walk(_Jac.Walker):
+    count: int = _Jac.has_instance_default(gen_func=lambda: 0)
+
+    def start(self, _jac_here_: _Jac.RootType | Item) -> None:
+        _Jac.connect(left=_jac_here_, right=Item(), edge_spec=_Jac.build_edge(is_undirected=False, conn_type=None, conn_assign=None))
+        if self.count < 5:
+            if _Jac.visit_node(self, _Jac.edge_ref(_jac_here_, target_obj=None, dir=_Jac.EdgeDir.OUT, filter_func=None, edges_only=False)):
+                pass
+        else:
+            print('Created 5 items.')
+            _Jac.disengage(self)
+            return
+
+    def walk(self, _jac_here_: Item) -> None:
+        _jac_here_.value = self.count
+        print(f'Item value: {_jac_here_.value}')
+        self.count += 1
+        if _Jac.visit_node(self, _Jac.edge_ref(_jac_here_, target_obj=None, dir=_Jac.EdgeDir.OUT, filter_func=None, edges_only=False)):
+            pass
+        else:
+            print('Finished walking over all items.')
+            _Jac.disengage(self)
+            return
\ No newline at end of file
@@ -0,0 +1,4 @@
+from __future__ import annotations
+if __name__ == '__main__':
+    pass
+print('i work')
\ No newline at end of file
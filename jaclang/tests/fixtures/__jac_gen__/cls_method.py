@@ -0,0 +1,32 @@
+"""Test file for class method."""
+from __future__ import annotations
+from jaclang.plugin.feature import JacFeature as _Jac
+from jaclang.plugin.builtin import *
+
+class MyClass:
+
+    def simple_method() -> str:
+        return 'Hello, World1!'
+
+    @classmethod
+    def my_method(cls: Type[MyClass]) -> str:
+        x = cls.__name__
+        print(x)
+        return 'Hello, World2!'
+a = MyClass.simple_method()
+b = MyClass.my_method()
+print(a, b)
+
+class MyClass2:
+
+    @_Jac.impl_patch_filename(file_loc='/root/package/jaclang/tests/fixtures/cls_method.jac')
+    def Ability_1(self: MyClass2) -> str:
+        return 'Hello, World!'
+
+    @classmethod
+    @_Jac.impl_patch_filename(file_loc='/root/package/jaclang/tests/fixtures/cls_method.jac')
+    def Ability_2(cls: Type[MyClass2]) -> str:
+        return 'Hello, World22!'
+a = MyClass2().Ability_1()
+b = MyClass2.Ability_2()
+print(a, b)
\ No newline at end of file
@@ -0,0 +1,12 @@
+from __future__ import annotations
+from jaclang import jac_import as __jac_import__
+import typing as _jac_typ
+if _jac_typ.TYPE_CHECKING:
+    import hello
+else:
+    hello, = __jac_import__(target='hello', base_path=__file__, lng='jac', absorb=False, mdl_alias=None, items={})
+if _jac_typ.TYPE_CHECKING:
+    import hello
+else:
+    hello, = __jac_import__(target='hello', base_path=__file__, lng='jac', absorb=False, mdl_alias=None, items={})
+hello.still_there()
\ No newline at end of file
@@ -0,0 +1,8 @@
+from __future__ import annotations
+from jaclang import jac_import as __jac_import__
+import typing as _jac_typ
+if _jac_typ.TYPE_CHECKING:
+    import pyfunc_1
+else:
+    pyfunc_1, = __jac_import__(target='pyfunc_1', base_path=__file__, lng='py', absorb=False, mdl_alias=None, items={})
+print('Deep convo is imported')
\ No newline at end of file
@@ -0,0 +1,16 @@
+from __future__ import annotations
+from dataclasses import field as __jac_field__
+from jaclang.plugin.feature import JacFeature as _Jac
+from jaclang.plugin.builtin import *
+from dataclasses import dataclass as __jac_dataclass__
+
+@_Jac.make_obj(on_entry=[], on_exit=[])
+@__jac_dataclass__(eq=False)
+class SomeObj(_Jac.Obj):
+    a: int = _Jac.has_instance_default(gen_func=lambda: 5)
+    b: int = __jac_field__(init=False)
+
+    def __post_init__(self) -> None:
+        self.b = self.a * 3
+ob = SomeObj()
+print(ob.a, ob.b)
\ No newline at end of file
@@ -0,0 +1,36 @@
+from __future__ import annotations
+from jaclang.plugin.feature import JacFeature as _Jac
+from jaclang.plugin.builtin import *
+from dataclasses import dataclass as __jac_dataclass__
+
+@_Jac.make_node(on_entry=[], on_exit=[])
+@__jac_dataclass__(eq=False)
+class c(_Jac.Node):
+    cc: int = _Jac.has_instance_default(gen_func=lambda: 9)
+
+@_Jac.make_edge(on_entry=[], on_exit=[])
+@__jac_dataclass__(eq=False)
+class aaa(_Jac.Edge):
+    vvv: int = _Jac.has_instance_default(gen_func=lambda: 45)
+
+@_Jac.make_node(on_entry=[], on_exit=[])
+@__jac_dataclass__(eq=False)
+class a(_Jac.Node):
+    aa: int = _Jac.has_instance_default(gen_func=lambda: 1)
+
+@_Jac.make_node(on_entry=[], on_exit=[])
+@__jac_dataclass__(eq=False)
+class b(_Jac.Node):
+    bb: int = _Jac.has_instance_default(gen_func=lambda: 4)
+x = [a(aa=x) for x in range(0, 3)]
+y = [b(bb=x) for x in range(0, 3)]
+z = [c(cc=x) for x in range(0, 3)]
+_Jac.connect(left=x, right=y, edge_spec=_Jac.build_edge(is_undirected=False, conn_type=None, conn_assign=None))
+_Jac.connect(left=y, right=z, edge_spec=_Jac.build_edge(is_undirected=False, conn_type=None, conn_assign=None))
+apple: int
+print(_Jac.edge_ref(_Jac.edge_ref(x, target_obj=y, dir=_Jac.EdgeDir.OUT, filter_func=None, edges_only=False), target_obj=z, dir=_Jac.EdgeDir.OUT, filter_func=None, edges_only=False))
+print(_Jac.edge_ref(x, target_obj=None, dir=_Jac.EdgeDir.OUT, filter_func=None, edges_only=False))
+print(_Jac.disconnect(x, y, _Jac.EdgeDir.OUT, None))
+print(_Jac.edge_ref(x, target_obj=None, dir=_Jac.EdgeDir.OUT, filter_func=None, edges_only=False))
+print([i.__class__.__name__ for i in _Jac.connect(left=x, right=y, edge_spec=_Jac.build_edge(is_undirected=False, conn_type=None, conn_assign=None))])
+print([i.__class__.__name__ for i in _Jac.edge_ref(x[0], target_obj=y, dir=_Jac.EdgeDir.OUT, filter_func=None, edges_only=True)])
\ No newline at end of file
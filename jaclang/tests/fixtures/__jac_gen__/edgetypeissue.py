@@ -0,0 +1,16 @@
+from __future__ import annotations
+from jaclang.plugin.feature import JacFeature as _Jac
+from jaclang.plugin.builtin import *
+from dataclasses import dataclass as __jac_dataclass__
+
+@_Jac.make_node(on_entry=[], on_exit=[])
+@__jac_dataclass__(eq=False)
+class x(_Jac.Node):
+    pass
+
+@_Jac.make_edge(on_entry=[], on_exit=[])
+@__jac_dataclass__(eq=False)
+class e(_Jac.Edge):
+    name: str
+nodes = _Jac.connect(left=_Jac.get_root(), right=x(), edge_spec=_Jac.build_edge(is_undirected=False, conn_type=e(name='hello'), conn_assign=None))
+print(nodes)
\ No newline at end of file
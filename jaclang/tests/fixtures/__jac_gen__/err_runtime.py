@@ -0,0 +1,9 @@
+from __future__ import annotations
+
+def bar(some_list: list) -> None:
+    invalid_index = 4
+    print(some_list[invalid_index])
+
+def foo() -> None:
+    bar([0, 1, 2, 3])
+foo()
\ No newline at end of file
@@ -0,0 +1,41 @@
+from __future__ import annotations
+from jaclang import jac_import as __jac_import__
+import typing as _jac_typ
+from jaclang.plugin.feature import JacFeature as _Jac
+from jaclang.plugin.builtin import *
+from dataclasses import dataclass as __jac_dataclass__
+if _jac_typ.TYPE_CHECKING:
+    from jaclang.plugin.feature import JacFeature as Jac
+else:
+    Jac, = __jac_import__(target='jaclang.plugin.feature', base_path=__file__, lng='py', absorb=False, mdl_alias=None, items={'JacFeature': 'Jac'})
+if _jac_typ.TYPE_CHECKING:
+    from jaclang.runtimelib.machine import JacMachine
+else:
+    JacMachine, = __jac_import__(target='jaclang.runtimelib.machine', base_path=__file__, lng='py', absorb=False, mdl_alias=None, items={'JacMachine': None})
+if _jac_typ.TYPE_CHECKING:
+    from bar import bar_walk
+else:
+    bar_walk, = __jac_import__(target='bar', base_path=__file__, lng='jac', absorb=False, mdl_alias=None, items={'bar_walk': None})
+
+def test_run() -> None:
+    modules = JacMachine.get().list_modules()
+    print('Loaded Modules:')
+    for mod_name in modules:
+        print(f'Module: {mod_name}')
+    walkers = JacMachine.get().list_walkers(mod_name)
+    if walkers:
+        print(f'Walkers in {mod_name}:')
+        for walker in walkers:
+            print(f'  - Walker: {walker}')
+    nodes = JacMachine.get().list_nodes(mod_name)
+    if nodes:
+        print(f'Nodes in {mod_name}:')
+        for node in nodes:
+            print(f'  - Node: {node}')
+    edges = JacMachine.get().list_edges(mod_name)
+    if edges:
+        print(f'Edges in {mod_name}:')
+        for edge in edges:
+            print(f'  - Edge: {edge}')
+    _Jac.spawn_call(_Jac.get_root(), bar_walk())
+test_run()
\ No newline at end of file
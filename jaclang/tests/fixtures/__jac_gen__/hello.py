@@ -0,0 +1,6 @@
+"""Hello World!"""
+from __future__ import annotations
+
+def still_there() -> None:
+    print('im still here')
+print('Hello World!')
\ No newline at end of file
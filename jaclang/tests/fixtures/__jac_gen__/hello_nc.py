@@ -0,0 +1,3 @@
+"""Hello World!"""
+from __future__ import annotations
+print('Hello World!')
\ No newline at end of file
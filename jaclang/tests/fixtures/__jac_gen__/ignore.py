@@ -0,0 +1,49 @@
+"""Testing ignore."""
+from __future__ import annotations
+from jaclang import jac_import as __jac_import__
+import typing as _jac_typ
+from jaclang.plugin.feature import JacFeature as _Jac
+from jaclang.plugin.builtin import *
+from dataclasses import dataclass as __jac_dataclass__
+
+@_Jac.make_walker(on_entry=[_Jac.DSFunc('start_game', _Jac.RootType)], on_exit=[])
+@__jac_dataclass__(eq=False)
+class GuessGame(_Jac.Walker):
+
+    @_Jac.impl_patch_filename(file_loc='/root/package/jaclang/tests/fixtures/ignore.jac')
+    def start_game(self, _jac_here_: _Jac.RootType) -> None:
+        i = 0
+        while i < 10:
+            _Jac.connect(left=_jac_here_, right=turn(), edge_spec=_Jac.build_edge(is_undirected=False, conn_type=None, conn_assign=None))
+            i += 1
+        if _Jac.visit_node(self, _Jac.edge_ref(_jac_here_, target_obj=None, dir=_Jac.EdgeDir.OUT, filter_func=None, edges_only=False)):
+            pass
+
+@_Jac.make_walker(on_entry=[_Jac.DSFunc('start_game', _Jac.RootType)], on_exit=[])
+@__jac_dataclass__(eq=False)
+class GuessGame2(_Jac.Walker):
+
+    @_Jac.impl_patch_filename(file_loc='/root/package/jaclang/tests/fixtures/ignore.jac')
+    def start_game(self, _jac_here_: _Jac.RootType) -> None:
+        i = 0
+        while i < 10:
+            _Jac.connect(left=_jac_here_, right=turn(), edge_spec=_Jac.build_edge(is_undirected=False, conn_type=None, conn_assign=None))
+            i += 1
+        i = 0
+        while i < 15:
+            _Jac.ignore(self, _Jac.edge_ref(_jac_here_, target_obj=None, dir=_Jac.EdgeDir.OUT, filter_func=None, edges_only=False)[i])
+            i += 1
+        if _Jac.visit_node(self, _Jac.edge_ref(_jac_here_, target_obj=None, dir=_Jac.EdgeDir.OUT, filter_func=None, edges_only=False)):
+            pass
+
+@_Jac.make_node(on_entry=[_Jac.DSFunc('check', GuessGame | GuessGame2)], on_exit=[])
+@__jac_dataclass__(eq=False)
+class turn(_Jac.Node):
+
+    @_Jac.impl_patch_filename(file_loc='/root/package/jaclang/tests/fixtures/ignore.jac')
+    def check(self, _jac_here_: GuessGame | GuessGame2) -> None:
+        print('here', end=', ')
+_Jac.spawn_call(_Jac.get_root(), GuessGame())
+print('')
+_Jac.spawn_call(_Jac.get_root(), GuessGame2())
+print('')
\ No newline at end of file
@@ -0,0 +1,11 @@
+"""Python function."""
+from __future__ import annotations
+from jaclang import jac_import as __jac_import__
+import typing as _jac_typ
+from jaclang.plugin.feature import JacFeature as _Jac
+from jaclang.plugin.builtin import *
+from dataclasses import dataclass as __jac_dataclass__
+
+def my_print(x: object) -> None:
+    """Print function."""
+    print(x)
\ No newline at end of file
@@ -0,0 +1,39 @@
+from __future__ import annotations
+from jaclang import jac_import as __jac_import__
+import typing as _jac_typ
+from jaclang.plugin.feature import JacFeature as _Jac
+from jaclang.plugin.builtin import *
+from dataclasses import dataclass as __jac_dataclass__
+if _jac_typ.TYPE_CHECKING:
+    from math import sin as s, cos, sqrt as sq
+else:
+    s, cos, sq = __jac_import__(target='math', base_path=__file__, lng='py', absorb=False, mdl_alias=None, items={'sin': 's', 'cos': None, 'sqrt': 'sq'})
+if _jac_typ.TYPE_CHECKING:
+    from random import *
+else:
+    _jac_inc_random, = __jac_import__(target='random', base_path=__file__, lng='py', absorb=True, mdl_alias=None, items={})
+    for i in _jac_inc_random.__all__ if '__all__' in _jac_inc_random.__dict__ else _jac_inc_random.__dict__:
+        if not i.startswith('_'):
+            exec(f"{i}=_jac_inc_random.__dict__['{i}']")
+if _jac_typ.TYPE_CHECKING:
+    from test_cli import JacCliTests as Jac
+else:
+    Jac, = __jac_import__(target='..test_cli', base_path=__file__, lng='py', absorb=False, mdl_alias=None, items={'JacCliTests': 'Jac'})
+if _jac_typ.TYPE_CHECKING:
+    from deep.mycode import code as c
+else:
+    c, = __jac_import__(target='deep.mycode', base_path=__file__, lng='jac', absorb=False, mdl_alias=None, items={'code': 'c'})
+if _jac_typ.TYPE_CHECKING:
+    import hashcheck as h, assign_compr as a
+else:
+    h, = __jac_import__(target='hashcheck', base_path=__file__, lng='jac', absorb=False, mdl_alias='h', items={})
+    a, = __jac_import__(target='assign_compr', base_path=__file__, lng='jac', absorb=False, mdl_alias='a', items={})
+if _jac_typ.TYPE_CHECKING:
+    from jacsamp import my_print as m
+else:
+    m, = __jac_import__(target='jacsamp', base_path=__file__, lng='jac', absorb=False, mdl_alias=None, items={'my_print': 'm'})
+print(sq(4), s(30), cos(30))
+print(randint(1, 10))
+print(m('--->my_print<---'))
+print(h.a, a.mvar)
+print(c())
\ No newline at end of file
@@ -0,0 +1,21 @@
+from __future__ import annotations
+from jaclang.plugin.feature import JacFeature as _Jac
+from jaclang.plugin.builtin import *
+x = 5
+y = 2
+
+@_Jac.create_test
+def test_a(_jac_check) -> None:
+    _jac_check.assertAlmostEqual(5, x)
+
+@_Jac.create_test
+def test_b(_jac_check) -> None:
+    _jac_check.assertIn('l', 'llm')
+
+@_Jac.create_test
+def test_c(_jac_check) -> None:
+    _jac_check.assertEqual(x - y, 3)
+
+@_Jac.create_test
+def test_d(_jac_check) -> None:
+    _jac_check.assertEqual(1, 2)
\ No newline at end of file
@@ -0,0 +1,15 @@
+from __future__ import annotations
+from jaclang import jac_import as __jac_import__
+import typing as _jac_typ
+from jaclang.plugin.feature import JacFeature as _Jac
+from jaclang.plugin.builtin import *
+if _jac_typ.TYPE_CHECKING:
+    from math import sqrt
+else:
+    sqrt, = __jac_import__(target='math', base_path=__file__, lng='py', absorb=False, mdl_alias=None, items={'sqrt': None})
+
+@_Jac.impl_patch_filename(file_loc='/root/package/jaclang/tests/fixtures/mtest.impl.jac')
+def math() -> None:
+    return sqrt(4)
+notmath = math()
+print(notmath)
\ No newline at end of file
@@ -0,0 +1,19 @@
+from __future__ import annotations
+from jaclang.plugin.feature import JacFeature as _Jac
+from jaclang.plugin.builtin import *
+from dataclasses import dataclass as __jac_dataclass__
+
+@_Jac.make_obj(on_entry=[], on_exit=[])
+@__jac_dataclass__(eq=False)
+class Foo(_Jac.Obj):
+    a: int = _Jac.has_instance_default(gen_func=lambda: 5)
+
+    def say(self) -> None:
+        print(self.a)
+
+    @_Jac.impl_patch_filename(file_loc='/root/package/jaclang/tests/fixtures/nosigself.jac')
+    def say2(self) -> None:
+        print(self.a)
+f = Foo()
+f.say()
+f.say2()
\ No newline at end of file
@@ -0,0 +1,12 @@
+from __future__ import annotations
+hello_world_bytes = b'Hello World'
+print(hello_world_bytes)
+print(type(hello_world_bytes))
+ret_str = 'Hello\\\\nWorld'
+print(ret_str)
+br = b'Hello\\\\nWorld'
+print(br)
+print(type(br))
+rb = b'Hello\\\\nWorld'
+print(rb)
+print(type(rb))
\ No newline at end of file
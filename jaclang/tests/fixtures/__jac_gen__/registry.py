@@ -0,0 +1,41 @@
+from __future__ import annotations
+from jaclang.plugin.feature import JacFeature as _Jac
+from jaclang.plugin.builtin import *
+from dataclasses import dataclass as __jac_dataclass__
+from enum import Enum as __jac_Enum__, auto as __jac_auto__
+
+@_Jac.make_obj(on_entry=[], on_exit=[])
+@__jac_dataclass__(eq=False)
+class model(_Jac.Obj):
+
+    def __infer__(self, meaning_in: str, **kwargs: dict) -> None:
+        print(meaning_in)
+llm = model()
+
+@_Jac.make_obj(on_entry=[], on_exit=[])
+@__jac_dataclass__(eq=False)
+class Person(_Jac.Obj):
+    name: str
+    age: int
+
+class Personality(__jac_Enum__):
+    INTROVERT = 9
+    EXTROVERT = __jac_auto__()
+personality_examples: dict[str, Personality | None] = {'Albert Einstein': Personality.INTROVERT, 'Barack Obama': Personality.EXTROVERT}
+person_value: list[tuple[dict[str, Personality], int]] = -90
+
+def genai_ability(x: str) -> str:
+    raise ImportError('mtllm is not installed. Please install it with `pip install mtllm` and run `jac clean`.')
+
+def normal_ability(x: str) -> str:
+    y = 10
+    return x
+
+def foo() -> None:
+    person_value = 22
+
+    def bar() -> None:
+        person_value = 33
+einstein_age: int = 75
+einstein_age += 1
+einstein = Person('Albert Einstein', einstein_age)
\ No newline at end of file
@@ -0,0 +1,21 @@
+from __future__ import annotations
+from jaclang.plugin.feature import JacFeature as _Jac
+from jaclang.plugin.builtin import *
+a = 5
+b = 2
+
+@_Jac.create_test
+def test_t1(_jac_check) -> None:
+    _jac_check.assertAlmostEqual(a, 6)
+
+@_Jac.create_test
+def test_t2(_jac_check) -> None:
+    _jac_check.assertNotEqual(a, b)
+
+@_Jac.create_test
+def test_t3(_jac_check) -> None:
+    _jac_check.assertIn('d', 'abc')
+
+@_Jac.create_test
+def test_t4(_jac_check) -> None:
+    _jac_check.assertEqual(a - b, 3)
\ No newline at end of file
@@ -0,0 +1,33 @@
+from __future__ import annotations
+from enum import Enum as __jac_Enum__, auto as __jac_auto__
+from jaclang.plugin.feature import JacFeature as _Jac
+from jaclang.plugin.builtin import *
+from dataclasses import dataclass as __jac_dataclass__
+
+class emotion(__jac_Enum__):
+    Happy = __jac_auto__()
+    Sad = 1
+    Calm = __jac_auto__()
+    Angry = __jac_auto__()
+name: str = 'John Doe'
+age: int = 25
+something: str
+
+@_Jac.make_node(on_entry=[], on_exit=[])
+@__jac_dataclass__(eq=False)
+class personality(_Jac.Node):
+    niceness: int
+    likes: list[str]
+    currentMood: mood
+    apple: str
+
+@_Jac.make_walker(on_entry=[], on_exit=[])
+@__jac_dataclass__(eq=False)
+class journal(_Jac.Walker):
+    count: int
+
+def add() -> int:
+    pass
+
+def updateMood(something: str, something_else: int, without_semstr: float=5, *mood: str) -> str:
+    pass
\ No newline at end of file
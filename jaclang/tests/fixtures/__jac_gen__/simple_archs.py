@@ -0,0 +1,25 @@
+"""A Ninja Myca"""
+from __future__ import annotations
+from jaclang.plugin.feature import JacFeature as _Jac
+from jaclang.plugin.builtin import *
+from dataclasses import dataclass as __jac_dataclass__
+
+@_Jac.make_obj(on_entry=[], on_exit=[])
+@__jac_dataclass__(eq=False)
+class SimpleObj(_Jac.Obj):
+    var1: int
+    var2: int
+    var3: int = _Jac.has_instance_default(gen_func=lambda: 0)
+
+    def __post_init__(self) -> None:
+        print(self.var1, self.var2, self.var3)
+
+class SimpleClass:
+    var1: int
+    var2: int
+    var3: int = 0
+
+    def __init__(self: SimpleClass) -> None:
+        print(self.var3)
+SimpleObj(1, 2)
+SimpleClass()
\ No newline at end of file
@@ -0,0 +1,13 @@
+"""A Ninja Myca"""
+from __future__ import annotations
+from jaclang.plugin.feature import JacFeature as _Jac
+from jaclang.plugin.builtin import *
+
+def plan() -> None:
+
+    @_Jac.impl_patch_filename(file_loc='/root/package/jaclang/tests/fixtures/sub_abil_sep_multilev.jac')
+    def say_hi(m: str) -> None:
+        print(m)
+    print('Hello, world!')
+    say_hi("I'm a ninja Myca!")
+plan()
\ No newline at end of file
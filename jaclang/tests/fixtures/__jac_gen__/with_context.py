@@ -0,0 +1,25 @@
+from __future__ import annotations
+from jaclang.plugin.feature import JacFeature as _Jac
+from jaclang.plugin.builtin import *
+from dataclasses import dataclass as __jac_dataclass__
+
+@_Jac.impl_patch_filename(file_loc='/root/package/jaclang/tests/fixtures/with_context.jac')
+def __init__() -> None:
+    print('init')
+
+@_Jac.make_obj(on_entry=[], on_exit=[])
+@__jac_dataclass__(eq=False)
+class TestType(_Jac.Obj):
+
+    def __enter__(self) -> None:
+        print('im in')
+
+    def __exit__(self, exc_type: object, exc_value: object, traceback: object) -> None:
+        print('im out')
+x = TestType()
+with x:
+    print('in the middle')
+__init__()
+x = ['apple', 'banana', 'cherry']
+nums = [1, 2, 3, 4, 5, 6]
+print({fruit: nums[0:3] for i, fruit in enumerate(x)})
\ No newline at end of file
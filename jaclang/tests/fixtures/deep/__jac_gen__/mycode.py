@@ -0,0 +1,6 @@
+from __future__ import annotations
+from jaclang import jac_import as __jac_import__
+import typing as _jac_typ
+
+def code() -> str:
+    return 'Hello World!'
\ No newline at end of file
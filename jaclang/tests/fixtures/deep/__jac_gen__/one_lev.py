@@ -0,0 +1,10 @@
+from __future__ import annotations
+from jaclang import jac_import as __jac_import__
+import typing as _jac_typ
+if _jac_typ.TYPE_CHECKING:
+    from deeper import snd_lev as snd_lev
+else:
+    snd_lev, = __jac_import__(target='.deeper', base_path=__file__, lng='jac', absorb=False, mdl_alias=None, items={'snd_lev': 'snd_lev'})
+
+def olprint() -> str:
+    return 'one level deeper' + snd_lev.slprint()
\ No newline at end of file